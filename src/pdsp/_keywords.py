@@ -0,0 +1,39 @@
+"""
+Keyword tables for PDF classification (used by pdsp.extract).
+Everything is lowercase; document text and file names are lowercased before matching.
+"""
+from __future__ import annotations
+from typing import Dict, Tuple
+
+# kind -> (positives, negatives); each keyword found in the text counts once (+1 / -1)
+TEXT_KEYWORDS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "binder": (
+        ("binder", "cb-s", "co2", "co₂", "incubator", "model cb-s"),
+        (),
+    ),
+    "m12": (
+        ("m12", "sensorik", "aktorik", "serie 713", "serie 763", "ordering-no", "ordering code", "bestell-nr."),
+        ("technische information", "technische informationen", "allgemeine hinweise"),
+    ),
+    "techinfo": (
+        ("technische information", "technische informationen", "allgemeine hinweise", "awg"),
+        ("serie 713", "serie 763", "ordering-no", "ordering code", "bestell-nr.", "m12"),
+    ),
+}
+
+# kind -> (file-name substrings, bonus added once if any of them is in the name)
+FILENAME_HINTS: Dict[str, Tuple[Tuple[str, ...], int]] = {
+    "m12": (("serie_713_763", "m12"), 5),
+    "techinfo": (("technische_infos", "technische_info"), 5),
+}
+
+# kind -> file-name substrings specific enough to settle the kind without scoring the text
+# (the published file names of the three supported documents; "m12" alone is not enough,
+# the technical-information sheets are about M12 connectors too)
+FILENAME_KINDS: Dict[str, Tuple[str, ...]] = {
+    "m12": ("serie_713_763",),
+    "techinfo": ("technische_infos", "technische_info"),
+    "binder": ("cb-s 260", "cb-s_260", "cbs260"),
+}
+
+ALL_TEXT_KEYWORDS = frozenset(k for pos, neg in TEXT_KEYWORDS.values() for k in pos + neg)
@@ -1,18 +1,32 @@
 from __future__ import annotations
-import json
-from typing import Optional, Iterable
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Optional, Iterable, Iterator, List
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from pdsp.db import (
-    get_connection, ensure_schema, insert_products,
+    get_connection, ensure_schema, insert_products, bulk_load,
     query_by_model, query_by_brand, query_by_spec,
     query_specs_for_code, audit_spec_coverage, query_by_spec_text,
 )
-from pdsp.extract import extract_products
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# NOTE: rich and pdsp.extract (pdfplumber / camelot) are imported lazily so that
+# `pdsp --help` and the query commands don't pay the PDF stack's import cost.
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    from rich.console import Console
+    return Console()
+
+
+# result tables are rendered (and flushed) in pages of this many rows
+DEFAULT_PAGE_SIZE = 100
+
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
 query_app = typer.Typer(help="Query subcommands")
@@ -24,27 +38,26 @@ def process(
     pdf_dir: str = typer.Argument(..., help="Path to directory containing PDFs"),
     db: str = typer.Option("products.sqlite", "--db", help="SQLite database file"),
     jsonl: Optional[str] = typer.Option("products.jsonl", "--jsonl", help="Optional JSONL export"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", min=1, help="Parallel PDF workers (default: CPU count)"),
 ):
+    from pdsp.extract import extract_products
+
     # 1) extract
-    products = extract_products(pdf_dir)
+    products = extract_products(pdf_dir, workers=workers)
     if not products:
-        console.print("[yellow]No PDFs found or directory empty.[/yellow]")
+        _console().print("[yellow]No PDFs found or directory empty.[/yellow]")
 
-    # 2) store
+    # 2) store (+ optional JSONL export in the same pass)
     conn = get_connection(db)
     ensure_schema(conn)
-    inserted_ids = insert_products(conn, products)
-
-    # 3) optional JSONL export
-    if jsonl is not None:
-        with open(jsonl, "w", encoding="utf-8") as f:
-            for p in products:
-                f.write(json.dumps(p, ensure_ascii=False) + "\n")
+    jsonl_ctx = open(jsonl, "wb") if jsonl is not None else nullcontext()
+    with jsonl_ctx as jsonl_fp, bulk_load(conn):
+        inserted_ids = insert_products(conn, products, jsonl_fp=jsonl_fp)
 
-    # 4) report
-    console.print(f"[bold green]Processed[/bold green] {len(inserted_ids)} products → {db}")
+    # 3) report
+    _console().print(f"[bold green]Processed[/bold green] {len(inserted_ids)} products → {db}")
     if jsonl is not None:
-        console.print(f"[bold cyan]Export[/bold cyan] → {jsonl}")
+        _console().print(f"[bold cyan]Export[/bold cyan] → {jsonl}")
 
 
 @app.command(help="Inspect all specs for a given ordering code or model")
@@ -54,15 +67,18 @@ def inspect(
 ):
     conn = get_connection(db)
     rows = query_specs_for_code(conn, code)
-    if not rows:
-        console.print("[yellow]No specs found for this code.[/yellow]")
+    first = next(rows, None)
+    if first is None:
+        _console().print("[yellow]No specs found for this code.[/yellow]")
         raise typer.Exit(code=0)
 
+    from rich.table import Table
+
     t = Table(title=f"Specs for {code}")
     t.add_column("product_id"); t.add_column("spec_key"); t.add_column("spec_value_num"); t.add_column("spec_value_text"); t.add_column("unit"); t.add_column("raw")
-    for r in rows:
-        t.add_row(str(r["product_id"]), r["spec_key"], str(r["spec_value_num"]), str(r["spec_value_text"]), str(r.get("unit") or ""), str(r.get("raw") or ""))
-    console.print(t)
+    for r in chain((first,), rows):
+        t.add_row(str(r["product_id"]), r["spec_key"], str(r["spec_value_num"]), str(r["spec_value_text"]), str(r["unit"] or ""), str(r["raw"] or ""))
+    _console().print(t)
 
 
 @app.command(help="Report coverage per spec_key (how many rows; how many numeric)")
@@ -71,16 +87,19 @@ def audit(
 ):
     conn = get_connection(db)
     rows = audit_spec_coverage(conn)
-    if not rows:
-        console.print("[yellow]No specs in database.[/yellow]")
+    first = next(rows, None)
+    if first is None:
+        _console().print("[yellow]No specs in database.[/yellow]")
         raise typer.Exit(code=0)
 
+    from rich.table import Table
+
     t = Table(title="Spec coverage")
     for col in ["spec_key", "total_rows", "numeric_rows"]:
         t.add_column(col)
-    for r in rows:
+    for r in chain((first,), rows):
         t.add_row(r["spec_key"], str(r["total_rows"]), str(r["numeric_rows"]))
-    console.print(t)
+    _console().print(t)
     
 
 @app.command(help="List distinct spec keys, optionally filtered by product.")
@@ -101,15 +120,15 @@ def keys(
     params: list[str] = []
 
     if brand:
-        where_clauses.append("p.brand = ?")
+        where_clauses.append("p.brand = ? COLLATE NOCASE")
         params.append(brand)
 
     if family:
-        where_clauses.append("p.family = ?")
+        where_clauses.append("p.family = ? COLLATE NOCASE")
         params.append(family)
 
     if code:
-        where_clauses.append("(p.ordering_code = ? OR p.model_no = ?)")
+        where_clauses.append("(p.ordering_code = ? COLLATE NOCASE OR p.model_no = ? COLLATE NOCASE)")
         params.extend([code, code])
 
     where_sql = ""
@@ -128,36 +147,40 @@ def keys(
     rows = cur.fetchall()
 
     if not rows:
-        console.print("[yellow]No spec keys found for this filter.[/yellow]")
+        _console().print("[yellow]No spec keys found for this filter.[/yellow]")
         raise typer.Exit(code=0)
 
+    from rich.table import Table
+
     table = Table(title="spec_key values")
     table.add_column("spec_key")
 
     for (spec_key,) in rows:
         table.add_row(spec_key or "")
 
-    console.print(table)
+    _console().print(table)
     
 
 @query_app.command("by-model")
 def by_model(
     db: str = typer.Option("products.sqlite", "--db"),
     model: str = typer.Option(..., "--model", "-m"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Rows per printed table page"),
 ):
     conn = get_connection(db)
     rows = query_by_model(conn, model)
-    _print_products(rows)
+    _print_products(rows, page_size)
 
 
 @query_app.command("by-brand")
 def by_brand(
     db: str = typer.Option("products.sqlite", "--db"),
     brand: str = typer.Option(..., "--brand", "-b"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Rows per printed table page"),
 ):
     conn = get_connection(db)
     rows = query_by_brand(conn, brand)
-    _print_products(rows)
+    _print_products(rows, page_size)
 
 
 @query_app.command("by-spec")
@@ -167,10 +190,11 @@ def by_spec(
     op: str = typer.Option(">=", "--op", help="One of =, !=, <, <=, >, >="),
     value: float = typer.Option(..., "--value"),
     unit: Optional[str] = typer.Option(None, "--unit"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Rows per printed table page"),
 ):
     conn = get_connection(db)
     rows = query_by_spec(conn, key, op, value)
-    _print_products_with_spec(rows)
+    _print_products_with_spec(rows, page_size)
 
 
 @query_app.command("by-spec-text")
@@ -179,76 +203,76 @@ def by_spec_text(
     key: str = typer.Option(..., "--key"),
     contains: Optional[str] = typer.Option(None, "--contains", help="substring match"),
     equals: Optional[str] = typer.Option(None, "--equals", help="case-insensitive exact"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Rows per printed table page"),
 ):
     conn = get_connection(db)
     rows = query_by_spec_text(conn, key, contains=contains, equals=equals)
-    _print_products_with_spec(rows)
+    _print_products_with_spec(rows, page_size)
 
 
-def _print_products(rows: Iterable):
-    rows = list(rows)
-    if not rows:
-        console.print("[yellow]No results[/yellow]")
-        return
+_PRODUCT_COLUMNS = (
+    "id", "brand", "family", "model_no", "article_number", "ordering_code", "product_name", "source_pdf",
+)
+_PRODUCT_SPEC_COLUMNS = (
+    "id", "brand", "family", "model_no", "ordering_code", "product_name",
+    "spec_key", "spec_value_num", "spec_value_text", "unit", "source_pdf",
+)
+# rendered as "" rather than "None" in the spec-filter table
+_BLANK_IF_NONE = frozenset({"spec_value_num", "spec_value_text", "unit", "source_pdf"})
 
-    t = Table(title="Products", show_lines=False)
-    for col in ["id", "brand", "family", "model_no", "article_number", "ordering_code", "product_name", "source_pdf"]:
-        t.add_column(col)
 
-    for r in rows:
-        t.add_row(
-            str(r.get("id") if isinstance(r, dict) else r["id"]),
-            str(r.get("brand") if isinstance(r, dict) else r["brand"]),
-            str(r.get("family") if isinstance(r, dict) else r["family"]),
-            str(r.get("model_no") if isinstance(r, dict) else r["model_no"]),
-            str(r.get("article_number") if isinstance(r, dict) else r["article_number"]),
-            str(r.get("ordering_code") if isinstance(r, dict) else r["ordering_code"]),
-            str(r.get("product_name") if isinstance(r, dict) else r["product_name"]),
-            str(r.get("source_pdf") if isinstance(r, dict) else r["source_pdf"]),
-        )
-    console.print(t)
-
-
-def _print_products_with_spec(rows: Iterable):
-    rows = list(rows)
-    if not rows:
-        console.print("[yellow]No results[/yellow]")
-        return
-
-    t = Table(title="Products (spec filter)", show_lines=False)
-    for col in [
-        "id",
-        "brand",
-        "family",
-        "model_no",
-        "ordering_code",
-        "product_name",
-        "spec_key",
-        "spec_value_num",
-        "spec_value_text",
-        "unit",
-        "source_pdf",
-    ]:
-        t.add_column(col)
+def _pages(rows: Iterable, page_size: int) -> Iterator[List]:
+    it = iter(rows)
+    while True:
+        page = list(islice(it, page_size))
+        if not page:
+            return
+        yield page
+
 
-    for row in rows:
-        r = dict(row) 
-
-        spec_value_num = r.get("spec_value_num")
-        spec_value_text = r.get("spec_value_text")
-
-        t.add_row(
-            str(r.get("id", "")),
-            str(r.get("brand", "")),
-            str(r.get("family", "")),
-            str(r.get("model_no", "")),
-            str(r.get("ordering_code", "")),
-            str(r.get("product_name", "")),
-            str(r.get("spec_key", "")),
-            "" if spec_value_num is None else str(spec_value_num),
-            "" if spec_value_text is None else str(spec_value_text),
-            str(r.get("unit", "") or ""),
-            str(r.get("source_pdf", "") or ""),
-        )
-
-    console.print(t)
+def _print_products(rows: Iterable, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Render product rows as a sequence of tables of `page_size` rows each, so large
+    results start printing immediately instead of being measured as one big table.
+    Each page is sized on its own rows and repeats the header.
+    """
+    from rich.table import Table
+
+    n_pages = 0
+    for page in _pages(rows, page_size):
+        # every page measures its own column widths, so each one repeats the header
+        t = Table(title="Products" if n_pages == 0 else None, show_lines=False)
+        for col in _PRODUCT_COLUMNS:
+            t.add_column(col)
+        for r in page:
+            t.add_row(*(str(r[c]) for c in _PRODUCT_COLUMNS))
+        _console().print(t)
+        n_pages += 1
+
+    if n_pages == 0:
+        _console().print("[yellow]No results[/yellow]")
+
+
+def _print_products_with_spec(rows: Iterable, page_size: int = DEFAULT_PAGE_SIZE):
+    from rich.table import Table
+
+    present = None
+    n_pages = 0
+    for page in _pages(rows, page_size):
+        if present is None:
+            # text queries don't select spec_value_num; work out the missing columns once
+            present = set(page[0].keys())
+
+        t = Table(title="Products (spec filter)" if n_pages == 0 else None, show_lines=False)
+        for col in _PRODUCT_SPEC_COLUMNS:
+            t.add_column(col)
+        for r in page:
+            t.add_row(*(
+                "" if c not in present or (c in _BLANK_IF_NONE and r[c] is None) else str(r[c])
+                for c in _PRODUCT_SPEC_COLUMNS
+            ))
+        _console().print(t)
+        n_pages += 1
+
+    if n_pages == 0:
+        _console().print("[yellow]No results[/yellow]")
@@ -1,35 +1,91 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
 import sqlite3
-import json
+import orjson
+
+
+def _dumps(obj: Any) -> str:
+    # orjson emits UTF-8 without escaping (same as json.dumps(..., ensure_ascii=False))
+    return orjson.dumps(obj).decode("utf-8")
 
 
 def get_connection(db_path: str) -> sqlite3.Connection:
     """
     Open a SQLite connection with sensible defaults:
     - foreign keys ON
+    - WAL journal with synchronous=NORMAL (one fsync per checkpoint, not per commit)
+    - temp tables in memory, ~200 MB page cache, 256 MB mmap
+    - a larger prepared-statement cache (256) so repeated inserts/queries skip re-preparing
     - row_factory returns dict-like rows
     """
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=256)
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -200000;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
     conn.row_factory = sqlite3.Row
     return conn
 
 
+@contextmanager
+def bulk_load(conn: sqlite3.Connection, check_foreign_keys: bool = True) -> Iterator[sqlite3.Connection]:
+    """
+    Relax durability for a one-shot bulk ingest (e.g. `pdsp process`):
+    - journal OFF, synchronous OFF, foreign keys OFF while inside the block
+    - WAL / NORMAL / foreign keys ON restored on exit
+    Since FK enforcement is skipped during the load, a single `PRAGMA foreign_key_check`
+    runs afterwards (unless disabled) and raises IntegrityError on orphaned specs.
+    A crash mid-load can leave the database inconsistent; rerun `process` in that case.
+    """
+    conn.commit()
+    conn.execute("PRAGMA foreign_keys = OFF;")
+    conn.execute("PRAGMA synchronous = OFF;")
+    conn.execute("PRAGMA journal_mode = OFF;")
+    try:
+        yield conn
+        conn.commit()
+        if check_foreign_keys:
+            violations = conn.execute("PRAGMA foreign_key_check(specs);").fetchall()
+            if violations:
+                raise sqlite3.IntegrityError(
+                    f"bulk load left {len(violations)} specs rows without a product "
+                    f"(first rowid: {violations[0]['rowid']})"
+                )
+    finally:
+        conn.commit()
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA foreign_keys = ON;")
+
+
+# Bump whenever ensure_schema's DDL changes; databases stamped with an older
+# PRAGMA user_version re-run the (idempotent) DDL below, newer ones skip it.
+SCHEMA_VERSION = 2
+
+
 def ensure_schema(conn: sqlite3.Connection) -> None:
     """
     Create tables and indexes if they don't exist.
+    A no-op when the database is already at SCHEMA_VERSION.
     """
+    (user_version,) = conn.execute("PRAGMA user_version;").fetchone()
+    if user_version >= SCHEMA_VERSION:
+        return
+
     # products table
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS products (
             id INTEGER PRIMARY KEY,
-            brand TEXT,
+            brand TEXT COLLATE NOCASE,
             family TEXT,
-            model_no TEXT,
+            model_no TEXT COLLATE NOCASE,
             article_number TEXT,
-            ordering_code TEXT,
+            ordering_code TEXT COLLATE NOCASE,
             product_name TEXT,
             description TEXT,
             interfaces TEXT,          -- comma-joined e.g., "RS-232,USB"
@@ -46,7 +102,7 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
         CREATE TABLE IF NOT EXISTS specs (
             id INTEGER PRIMARY KEY,
             product_id INTEGER NOT NULL,
-            spec_key TEXT NOT NULL,          -- normalized snake_case key
+            spec_key TEXT NOT NULL COLLATE NOCASE,  -- normalized snake_case key
             spec_value_num REAL,             -- numeric representation if applicable
             spec_value_text TEXT,            -- textual representation if not numeric
             unit TEXT,                       -- canonical unit label (e.g., V, A, °C, mm, mm2, %)
@@ -57,58 +113,200 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
         """
     )
 
-    # indexes for common lookups
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand);")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_model ON products(model_no);")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_ordering ON products(ordering_code);")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_specs_key_num ON specs(spec_key, spec_value_num);")
+    # indexes for common lookups; lookups are case-insensitive, so the indexes are NOCASE
+    # (explicit here so databases created before the columns were NOCASE get them too)
+    for old_index in ("idx_products_brand", "idx_products_model", "idx_products_ordering", "idx_specs_key_num"):
+        conn.execute(f"DROP INDEX IF EXISTS {old_index};")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_brand_nocase ON products(brand COLLATE NOCASE);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_model_nocase ON products(model_no COLLATE NOCASE);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_ordering_nocase ON products(ordering_code COLLATE NOCASE);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_specs_key_num_nocase ON specs(spec_key COLLATE NOCASE, spec_value_num);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_specs_product_id ON specs(product_id, spec_key);")
+
+    _ensure_specs_fts(conn)
 
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
     conn.commit()
 
 
-def insert_products(conn: sqlite3.Connection, products: Iterable[Dict[str, Any]]) -> List[int]:
+def _ensure_specs_fts(conn: sqlite3.Connection) -> None:
+    """
+    Trigram FTS5 index over specs.spec_value_text, kept in sync by triggers.
+    Trigrams make `MATCH '"ip68"'` behave like a case-insensitive substring search, so
+    `by-spec-text --contains` can use the index instead of a full LIKE '%x%' scan.
+    Only the column that query reads is indexed: every spec insert pays for the triggers.
+    Skipped when SQLite is built without FTS5; queries then fall back to LIKE.
     """
-    Insert a batch of product dicts.
-    Each product may include a 'specs' list to be inserted after we get the product_id.
+    if _has_specs_fts(conn):
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(specs_fts);")}
+        if "raw" not in columns:
+            return
+        # schema version 1 also indexed specs.raw; rebuild with spec_value_text only
+        for trigger in ("specs_fts_ai", "specs_fts_ad", "specs_fts_au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger};")
+        conn.execute("DROP TABLE specs_fts;")
+    try:
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE specs_fts USING fts5(
+                spec_value_text,
+                content='specs', content_rowid='id', tokenize='trigram'
+            );
+            """
+        )
+    except sqlite3.OperationalError:
+        return
+
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS specs_fts_ai AFTER INSERT ON specs BEGIN
+            INSERT INTO specs_fts(rowid, spec_value_text)
+            VALUES (new.id, new.spec_value_text);
+        END;
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS specs_fts_ad AFTER DELETE ON specs BEGIN
+            INSERT INTO specs_fts(specs_fts, rowid, spec_value_text)
+            VALUES ('delete', old.id, old.spec_value_text);
+        END;
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS specs_fts_au AFTER UPDATE ON specs BEGIN
+            INSERT INTO specs_fts(specs_fts, rowid, spec_value_text)
+            VALUES ('delete', old.id, old.spec_value_text);
+            INSERT INTO specs_fts(rowid, spec_value_text)
+            VALUES (new.id, new.spec_value_text);
+        END;
+        """
+    )
+    # index rows that were inserted before the FTS table existed
+    conn.execute("INSERT INTO specs_fts(specs_fts) VALUES ('rebuild');")
+
+
+def _has_specs_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'specs_fts';").fetchone()
+    return row is not None
+
+
+SQL_INSERT_PRODUCT = """
+    INSERT INTO products
+        (id, brand, family, model_no, article_number, ordering_code,
+         product_name, description, interfaces, source_pdf, pages_covered, provenance)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+SQL_INSERT_SPEC = """
+    INSERT INTO specs
+        (product_id, spec_key, spec_value_num, spec_value_text, unit, raw, applies_to)
+    VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+# specs rows bound per multi-row INSERT (7 params each; clamped to the connection's variable limit)
+SPEC_CHUNK_ROWS = 120
+_SPEC_COLUMNS = 7
+_SPEC_ROW_PLACEHOLDER = "(" + ", ".join("?" * _SPEC_COLUMNS) + ")"
+
+
+@lru_cache(maxsize=16)
+def _sql_insert_specs(n_rows: int) -> str:
+    # same text for every full chunk, so sqlite3's statement cache serves all but the last one
+    return SQL_INSERT_SPEC.replace(_SPEC_ROW_PLACEHOLDER, ", ".join([_SPEC_ROW_PLACEHOLDER] * n_rows))
+
+
+def _chunked(items: Sequence[Any], n: int) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(items), n):
+        yield items[i : i + n]
+
+
+def _rows_per_statement(conn: sqlite3.Connection, n_columns: int, wanted: int) -> int:
+    """
+    Clamp a multi-row VALUES chunk so it stays under SQLITE_LIMIT_VARIABLE_NUMBER.
+    Connection.getlimit is Python 3.11+; older versions assume the historic 999.
+    """
+    limit = 999
+    if hasattr(conn, "getlimit"):
+        limit = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    return max(1, min(wanted, limit // n_columns))
+
+
+def insert_products(
+    conn: sqlite3.Connection,
+    products: Iterable[Dict[str, Any]],
+    spec_chunk_rows: int = SPEC_CHUNK_ROWS,
+    jsonl_fp: Optional[IO[bytes]] = None,
+) -> List[int]:
+    """
+    Insert a batch of product dicts in a single transaction.
+    Each product may include a 'specs' list; specs are inserted after all products.
+    All rows (including the provenance / applies_to JSON) are built before the
+    transaction starts, keyed by the product's 1-based position in the batch; once
+    BEGIN IMMEDIATE holds the write lock, the positions are shifted by MAX(id) and the
+    rows go in with one executemany for products and multi-row
+    INSERT ... VALUES (...), (...) statements of `spec_chunk_rows` rows each for specs.
+    If `jsonl_fp` (opened in binary mode) is given, each product is also written to it
+    as one JSON line in the same pass, so callers don't have to walk the list twice.
     Returns list of inserted product IDs in the same order as input.
     """
-    inserted_ids: List[int] = []
-    for p in products:
-        # Prepare basic fields
-        brand = p.get("brand")
-        family = p.get("family")
-        model_no = p.get("model_no")
-        article_number = p.get("article_number")
-        ordering_code = p.get("ordering_code")
-        product_name = p.get("product_name")
-        description = p.get("description")
+    # lists rather than tuples: column 0 holds the batch offset until the real id is known
+    product_rows: List[List[Any]] = []
+    spec_rows: List[List[Any]] = []
+    for offset, p in enumerate(products, start=1):
         interfaces = ",".join(p.get("interfaces") or []) if p.get("interfaces") else None
-        source_pdf = p.get("source_pdf")
         pages_covered = ",".join(map(str, p.get("pages_covered") or [])) if p.get("pages_covered") else None
         provenance = p.get("provenance")
-        provenance_json = json.dumps(provenance, ensure_ascii=False) if provenance else None
+        provenance_json = _dumps(provenance) if provenance else None
 
-        cur = conn.execute(
-            """
-            INSERT INTO products
-                (brand, family, model_no, article_number, ordering_code,
-                 product_name, description, interfaces, source_pdf, pages_covered, provenance)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-            """,
-            [
-                brand, family, model_no, article_number, ordering_code,
-                product_name, description, interfaces, source_pdf, pages_covered, provenance_json,
-            ],
-        )
-        product_id = cur.lastrowid
-        inserted_ids.append(product_id)
+        product_rows.append([
+            offset,
+            p.get("brand"), p.get("family"), p.get("model_no"), p.get("article_number"),
+            p.get("ordering_code"), p.get("product_name"), p.get("description"),
+            interfaces, p.get("source_pdf"), pages_covered, provenance_json,
+        ])
+        if jsonl_fp is not None:
+            jsonl_fp.write(orjson.dumps(p))
+            jsonl_fp.write(b"\n")
 
-        # Insert specs if present
         for s in p.get("specs", []):
-            insert_spec(conn, product_id, s)
+            applies_to = s.get("applies_to")
+            applies_to_json = _dumps(applies_to) if applies_to else None
+            spec_rows.append([
+                offset,
+                s.get("spec_key"),
+                s.get("spec_value_num"),
+                s.get("spec_value_text"),
+                s.get("unit"),
+                s.get("raw"),
+                applies_to_json,
+            ])
+
+    if conn.in_transaction:
+        conn.commit()
+
+    cur = conn.cursor()
+    cur.execute("BEGIN IMMEDIATE;")
+    try:
+        (max_id,) = cur.execute("SELECT COALESCE(MAX(id), 0) FROM products;").fetchone()
+        if max_id:
+            for row in product_rows:
+                row[0] += max_id
+            for row in spec_rows:
+                row[0] += max_id
+
+        cur.executemany(SQL_INSERT_PRODUCT, product_rows)
+
+        chunk_rows = _rows_per_statement(conn, _SPEC_COLUMNS, spec_chunk_rows)
+        for chunk in _chunked(spec_rows, chunk_rows):
+            cur.execute(_sql_insert_specs(len(chunk)), [v for row in chunk for v in row])
+    except Exception:
+        conn.rollback()
+        raise
 
     conn.commit()
-    return inserted_ids
+    return [row[0] for row in product_rows]
 
 
 def insert_spec(conn: sqlite3.Connection, product_id: int, spec: Dict[str, Any]) -> int:
@@ -119,14 +317,10 @@ def insert_spec(conn: sqlite3.Connection, product_id: int, spec: Dict[str, Any])
       raw (str|None), applies_to (dict|None)
     """
     applies_to = spec.get("applies_to")
-    applies_to_json = json.dumps(applies_to, ensure_ascii=False) if applies_to else None
+    applies_to_json = _dumps(applies_to) if applies_to else None
 
     cur = conn.execute(
-        """
-        INSERT INTO specs
-            (product_id, spec_key, spec_value_num, spec_value_text, unit, raw, applies_to)
-        VALUES (?, ?, ?, ?, ?, ?, ?);
-        """,
+        SQL_INSERT_SPEC,
         [
             product_id,
             spec.get("spec_key"),
@@ -140,32 +334,54 @@ def insert_spec(conn: sqlite3.Connection, product_id: int, spec: Dict[str, Any])
     return cur.lastrowid
 
 
-def query_by_model(conn: sqlite3.Connection, model: str) -> List[sqlite3.Row]:
+# Query functions return the live cursor rather than a fetched list, so callers can
+# render rows while SQLite is still producing them. Rows are sqlite3.Row (see
+# get_connection), which supports r["col"] / r[i] / r.keys() without building dicts.
+
+
+def query_by_model(conn: sqlite3.Connection, model: str) -> Iterator[sqlite3.Row]:
     """
     Exact-match on model_no OR ordering_code (case-insensitive).
     """
-    rows = conn.execute(
+    return conn.execute(
         """
         SELECT *
         FROM products
-        WHERE lower(coalesce(model_no, '')) = lower(?)
-           OR lower(coalesce(ordering_code, '')) = lower(?);
+        WHERE model_no = ? COLLATE NOCASE
+           OR ordering_code = ? COLLATE NOCASE;
         """,
         [model, model],
-    ).fetchall()
-    return rows
+    )
 
 
-def query_by_brand(conn: sqlite3.Connection, brand: str) -> List[sqlite3.Row]:
-    rows = conn.execute(
+def query_by_brand(conn: sqlite3.Connection, brand: str) -> Iterator[sqlite3.Row]:
+    return conn.execute(
         """
         SELECT *
         FROM products
-        WHERE lower(coalesce(brand, '')) = lower(?);
+        WHERE brand = ? COLLATE NOCASE;
         """,
         [brand],
-    ).fetchall()
-    return rows
+    )
+
+
+_SQL_QUERY_BY_SPEC = """
+    SELECT
+        p.*,
+        s.spec_key,
+        s.spec_value_num,
+        s.spec_value_text,
+        s.unit
+    FROM specs AS s
+    JOIN products AS p ON p.id = s.product_id
+    WHERE s.spec_key = ? COLLATE NOCASE
+      AND s.spec_value_num {op} ?;
+"""
+
+# one fixed statement text per supported operator, so repeat queries hit the statement cache
+_SPEC_SQL: Dict[str, str] = {
+    op: _SQL_QUERY_BY_SPEC.format(op=op) for op in ("=", "!=", "<", "<=", ">", ">=")
+}
 
 
 def query_by_spec(
@@ -173,38 +389,20 @@ def query_by_spec(
     key: str,
     op: str,
     value: float,
-) -> List[sqlite3.Row]:
+) -> Iterator[sqlite3.Row]:
     """
     Filter products by numeric spec (e.g., rated_voltage >= 24).
     Supported ops: =, !=, <, <=, >, >=
     Returns joined rows (products + matching spec columns).
     """
-    allowed_ops = {"=", "!=", "<", "<=", ">", ">="}
-    if op not in allowed_ops:
+    sql = _SPEC_SQL.get(op)
+    if sql is None:
         raise ValueError(f"unsupported operator: {op}")
 
-    sql = f"""
-        SELECT
-            p.*,
-            s.spec_key,
-            s.spec_value_num,
-            s.spec_value_text,
-            s.unit
-        FROM specs AS s
-        JOIN products AS p ON p.id = s.product_id
-        WHERE lower(s.spec_key) = lower(?)
-          AND s.spec_value_num {op} ?;
-    """
-    rows = conn.execute(sql, [key, value]).fetchall()
-    return rows
-
-from typing import List, Dict, Any, Optional
-import sqlite3
-
-# ... keep existing imports and functions ...
+    return conn.execute(sql, [key, value])
 
 
-def query_specs_for_code(conn: sqlite3.Connection, code: str) -> List[Dict[str, Any]]:
+def query_specs_for_code(conn: sqlite3.Connection, code: str) -> Iterator[sqlite3.Row]:
     """
     Return all specs for the product whose ordering_code == code
     (or model_no == code as fallback).
@@ -213,15 +411,14 @@ def query_specs_for_code(conn: sqlite3.Connection, code: str) -> List[Dict[str,
     SELECT s.product_id, s.spec_key, s.spec_value_num, s.spec_value_text, s.unit, s.raw
     FROM specs s
     JOIN products p ON p.id = s.product_id
-    WHERE (p.ordering_code = ? OR p.model_no = ?)
+    WHERE (p.ordering_code = ? COLLATE NOCASE OR p.model_no = ? COLLATE NOCASE)
     ORDER BY s.spec_key
     """
     cur = conn.execute(sql, (code, code))
-    cols = [d[0] for d in cur.description]
-    return [dict(zip(cols, r)) for r in cur.fetchall()]
+    return cur
 
 
-def audit_spec_coverage(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+def audit_spec_coverage(conn: sqlite3.Connection) -> Iterator[sqlite3.Row]:
     """
     Count how many rows each spec_key appears on, and how many are numeric.
     """
@@ -235,20 +432,31 @@ def audit_spec_coverage(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     ORDER BY total_rows DESC, spec_key ASC
     """
     cur = conn.execute(sql)
-    cols = [d[0] for d in cur.description]
-    return [dict(zip(cols, r)) for r in cur.fetchall()]
+    return cur
 
 
-def query_by_spec_text(conn: sqlite3.Connection, key: str, contains: Optional[str] = None, equals: Optional[str] = None) -> List[Dict[str, Any]]:
+def query_by_spec_text(conn: sqlite3.Connection, key: str, contains: Optional[str] = None, equals: Optional[str] = None) -> Iterator[sqlite3.Row]:
     """
-    Text-based spec filter. Either 'contains' (ILIKE) or 'equals' (case-insensitive exact).
+    Text-based spec filter. Either 'contains' (case-insensitive substring) or 'equals'
+    (case-insensitive exact). 'contains' uses the trigram FTS index when available;
+    trigrams need at least 3 characters, shorter needles fall back to LIKE.
     """
-    if contains:
+    if contains and len(contains) >= 3 and _has_specs_fts(conn):
+        sql = """
+        SELECT p.*, s.spec_key, s.spec_value_text, s.unit
+        FROM specs_fts f
+        JOIN specs s ON s.id = f.rowid
+        JOIN products p ON p.id = s.product_id
+        WHERE f.spec_value_text MATCH ? AND s.spec_key = ? COLLATE NOCASE
+        """
+        phrase = '"' + contains.replace('"', '""') + '"'
+        cur = conn.execute(sql, (phrase, key))
+    elif contains:
         sql = """
         SELECT p.*, s.spec_key, s.spec_value_text, s.unit
         FROM products p
         JOIN specs s ON s.product_id = p.id
-        WHERE s.spec_key = ? AND s.spec_value_text LIKE ?
+        WHERE s.spec_key = ? COLLATE NOCASE AND s.spec_value_text LIKE ?
         """
         cur = conn.execute(sql, (key, f"%{contains}%"))
     elif equals:
@@ -256,10 +464,9 @@ def query_by_spec_text(conn: sqlite3.Connection, key: str, contains: Optional[st
         SELECT p.*, s.spec_key, s.spec_value_text, s.unit
         FROM products p
         JOIN specs s ON s.product_id = p.id
-        WHERE s.spec_key = ? AND LOWER(s.spec_value_text) = LOWER(?)
+        WHERE s.spec_key = ? COLLATE NOCASE AND LOWER(s.spec_value_text) = LOWER(?)
         """
         cur = conn.execute(sql, (key, equals))
     else:
-        return []
-    cols = [d[0] for d in cur.description]
-    return [dict(zip(cols, r)) for r in cur.fetchall()]
+        return iter(())
+    return cur
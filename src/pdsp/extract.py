@@ -1,8 +1,22 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import os
 import re
+import importlib.util
 import collections
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import orjson
+
+try:
+    import pymupdf as fitz
+except Exception:
+    try:
+        import fitz
+    except Exception:
+        fitz = None
 
 try:
     import pdfplumber
@@ -10,14 +24,41 @@ except Exception:
     pdfplumber = None
 
 try:
-    import camelot
+    import ahocorasick  # pyahocorasick: optional, speeds up keyword classification
 except Exception:
-    camelot = None
+    ahocorasick = None
 
-DISABLE_CAMELOT = os.environ.get("PDSP_CAMELOT", "").lower() in {"0", "off", "false", "no"}
-if DISABLE_CAMELOT:
-    camelot = None
+try:
+    import re2  # google-re2: optional linear-time (DFA) engine for the ordering-code scan
+except Exception:
+    re2 = None
 
+DISABLE_CAMELOT = os.environ.get("PDSP_CAMELOT", "").lower() in {"0", "off", "false", "no"}
+# camelot pulls in pandas / OpenCV and is only needed for M12 table pages, so it is
+# imported on first use (_camelot()); here it is only looked up, not imported
+CAMELOT_AVAILABLE = not DISABLE_CAMELOT and importlib.util.find_spec("camelot") is not None
+
+# Plain-text backend for classification and the CB-S / TI parsers: "pymupdf" (default
+# when installed) or "pdfplumber". The M12 parser always uses pdfplumber (it needs tables).
+PDF_BACKEND = os.environ.get("PDSP_PDF_BACKEND", "").lower()
+if PDF_BACKEND == "pdfplumber":
+    fitz = None
+
+# Default number of parallel PDF workers when extract_products() gets workers=None
+# (unset, empty, invalid or < 1 -> os.cpu_count()).
+try:
+    DEFAULT_WORKERS: Optional[int] = max(int(os.environ.get("PDSP_WORKERS", "")), 0) or None
+except ValueError:
+    DEFAULT_WORKERS = None
+
+# Per-PDF results are cached in <pdf_dir>/.pdsp_cache/ and reused while the file's
+# size + mtime (and the cache format / camelot setting) are unchanged.
+DISABLE_CACHE = os.environ.get("PDSP_CACHE", "").lower() in {"0", "off", "false", "no"}
+CACHE_DIRNAME = ".pdsp_cache"
+# bump whenever parser output changes, so stale cached products are not reused
+CACHE_VERSION = 4
+
+from pdsp._keywords import ALL_TEXT_KEYWORDS, FILENAME_HINTS, FILENAME_KINDS, TEXT_KEYWORDS
 from pdsp.normalize import (
     parse_mm_range,        # NEW
     parse_ip_code,         # NEW
@@ -26,43 +67,292 @@ from pdsp.normalize import (
     parse_contact_header,
 )
 
+# ----------------------------------------------------
+# Patterns (compiled once at import; the parsers run them per line / per row)
+# ----------------------------------------------------
+
+_WS_RE = re.compile(r"\s+")
+# no-break space -> space and the dash variants -> "-" (one C-level pass in the parsers' norm())
+_DASH_TABLE = str.maketrans({"\xa0": " ", "–": "-", "−": "-", "—": "-"})
+# pure digit-run patterns are ASCII-only: the numbers they pick out go through int()/float()
+# and the PDFs only use 0-9, so skipping the Unicode digit lookup changes nothing
+_DIGITS_RE = re.compile(r"\d+", re.ASCII)
+_DECIMAL_RE = re.compile(r"\d+(?:[.,]\d+)?", re.ASCII)
+_NON_FLOAT_CHARS_RE = re.compile(r"[^0-9+.\-eE]")
+_NON_ASCII_RE = re.compile(r"[^\x20-\x7E]+")
+
+# ordering codes, e.g. "99 0429 14 04" and variants with optional spaces.
+# The count pattern runs over every page during classification, so it uses RE2 when
+# installed (no backtracking on long digit runs). RE2's \b, \s and \d are ASCII-only;
+# the re fallback is compiled with re.ASCII so both engines count the same codes.
+# at most this many ordering codes count towards the m12 / techinfo scores
+_ORDERING_CODE_CAP = 100
+_ORDERING_CODE_COUNT_PATTERN = r"\b(?:9\d)\s?(?:\d{3,4}\s?){2,3}\d{2}\b"
+_ORDERING_CODE_COUNT_RE = (
+    re2.compile(_ORDERING_CODE_COUNT_PATTERN) if re2 is not None
+    else re.compile(_ORDERING_CODE_COUNT_PATTERN, re.ASCII)
+)
+_ORDERING_CODE_RE = re.compile(r"\b((?:9\d)\s?(?:\d{2,4}\s?){3,4})\b")
+_ORDERING_CODE_GROUPS_RE = re.compile(r"(?:9\d)\s+(\d+)\s+(\d+)\s+(\d{2})\b")
+_DIGIT_QUADS_RE = re.compile(r".{1,4}")
+
+# CB-S data sheet. The sheet text is normalized to single spaces and its numbers are 0-9,
+# so these run with re.ASCII: case-insensitive matching and \s/\d skip the Unicode tables
+# (the °, ±, ₂ literals still match as written).
+_CBS_ARTICLE_RE = re.compile(r"Article\s*Number\s+(\d{4}-\d{4})\s+(\d{4}-\d{4})", re.I | re.ASCII)
+_CBS_TEMP_RANGE_RE = re.compile(
+    r"Temperature\s*range\s+"
+    r"\+?\s*([0-9]+(?:[.,][0-9]+)?)\s*°C\s*above\s*ambient(?:\s*temperature)?"
+    r"\s*(?:to|–|-|…)\s*([0-9]+(?:[.,][0-9]+)?)\s*°C",
+    re.I | re.ASCII,
+)
+_CBS_HUMIDITY_RE = re.compile(
+    r"Humidity\s*range\s+"
+    r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*%\s*RH\s+"
+    r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*%\s*RH",
+    re.I | re.ASCII,
+)
+_CBS_CO2_RANGE_RE = re.compile(
+    r"CO[₂2]\s*range\s+"
+    r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*(?:Vol\.-?%|%)\s*CO2?\s+"
+    r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*(?:Vol\.-?%|%)\s*CO2?",
+    re.I | re.ASCII,
+)
+_CBS_CO2_RECOVERY_RE = re.compile(
+    r"CO[₂2]\s*recovery\s*time.*?for\s*30\s*s.*?(?:\r?\n)?\s*([0-9]+(?:[.,][0-9]+)?)\s*min\s+([0-9]+(?:[.,][0-9]+)?)\s*min",
+    re.I | re.S | re.ASCII,
+)
+_CBS_RATED_VOLTAGE_RE = re.compile(
+    r"Rated\s*Voltage\s+"
+    r"([0-9]{2,3})\s*\.\.\.\s*([0-9]{2,3})\s*V\s+"
+    r"([0-9]{2,3})\s*\.\.\.\s*([0-9]{2,3})\s*V",
+    re.I | re.ASCII,
+)
+_CBS_EXTERNAL_DIMS_RE = re.compile(
+    r"Width\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm.*?"
+    r"Height\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm.*?"
+    r"Depth\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm",
+    re.I | re.S | re.ASCII,
+)
+
+# M12 technical information
+_TI_IP_RE = re.compile(r"IP\d+[0-9K]?(?:\s*/\s*IP\d+[0-9K]?)*")
+_TI_CURRENT_RE = re.compile(r"([0-9.,\s/\-]+A(?:\s*/\s*[0-9.,\s]+A)*)\s*(.*)")
+_TI_CONTACTS_RE = re.compile(r"([0-9+\-PEF,\s]+)")
+_TI_CODING_HEADER_RE = re.compile(r"M12\s+(.+?)-KODIERUNG", re.I)
+
+# M12 713/763 small ordering tables
+_MM_ORDER_PAIR_RE = re.compile(r"([0-9,.\-–]+\s*mm)\s+((?:9\d)(?:\s?\d+){3,4})")
+_INLINE_CONTACTS_PAIR_RE = re.compile(r"((?:\d+\s+)+)([0-9,.\-–]+\s*mm)\s+((?:9\d)(?:\s?\d+){3,4})")
+_CONTACT_ANCHOR_RE = re.compile(r"(?m)^\s*(\d{1,2}(?:\s+\d{1,2})*)\s*$")
+# same \d as _CONTACT_ANCHOR_RE: every anchor it matches must yield its numbers here
+_CONTACT_NUM_RE = re.compile(r"\d{1,2}")
+_LOOSE_ORDER_RE = re.compile(r"(?:9\d)(?:\s?\d+){3,4}")
+_CONTACT_PREFIXED_ORDER_RE = re.compile(r"\s*(\d{1,2})\s+.*?(?:9\d)\s+(\d+)\s+(\d+)\s+\d{2}\b")
+
+
+# CB-S two-column rows 'label  v1  v2', one table per section of the sheet:
+# (label regex, value regex with one group, spec key, unit, raw suffix, scale).
+# scale None -> text spec (raw = value); otherwise spec_value_num = value * scale.
+_CbsPair = tuple[str, str, str, Optional[str], str, Optional[float]]
+_CBS_NUM = r"([0-9]+(?:[.,][0-9]+)?)"
+_CBS_TEMPERATURE_PAIRS: tuple[_CbsPair, ...] = (
+    (r"Temperature\s*uniformity\s*at\s*37\s*°C", _CBS_NUM + r"\s*±\s*K", "temp_uniformity_c", "°C", " ±K", 1.0),
+    (r"Temperature\s*fluctuation\s*at\s*37\s*°C", _CBS_NUM + r"\s*±\s*K", "temp_fluctuation_c", "°C", " ±K", 1.0),
+    (r"Recovery\s*time\s*after\s*door\s*was\s*opened\s*for\s*30\s*s\s*at\s*37\s*°C", _CBS_NUM + r"\s*min", "temp_recovery_min", "min", " min", 1.0),
+)
+_CBS_CO2_PAIRS: tuple[_CbsPair, ...] = (
+    (r"CO[₂2]\s*measuring\s*technology", r"(IR|NDIR)", "co2_sensor", None, "", None),
+)
+_CBS_ELECTRICAL_PAIRS: tuple[_CbsPair, ...] = (
+    (r"Power\s*frequency", r"(50/60|50|60)\s*Hz", "supply_freq_hz", None, "", None),
+    (r"Nominal\s*power", _CBS_NUM + r"\s*kW", "nominal_power_w", "W", " kW", 1000.0),
+    (r"Unit\s*fuse", _CBS_NUM + r"\s*A", "unit_fuse_a", "A", " A", 1.0),
+    (r"Phase\s*\(Nominal\s*voltage\)", r"([0-9]~)", "phase", None, "", None),
+)
+_CBS_MEASURE_PAIRS: tuple[_CbsPair, ...] = (
+    (r"Interior\s*volume", _CBS_NUM + r"\s*L", "interior_volume_l", "L", " L", 1.0),
+    (r"Net\s*weight.*?unit.*?\(empty\)", _CBS_NUM + r"\s*kg", "weight_kg", "kg", " kg", 1.0),
+    (r"Load\s*per\s*rack", _CBS_NUM + r"\s*kg", "shelf_max_load_kg", "kg", " kg", 1.0),
+    (r"Permitted\s*load", _CBS_NUM + r"\s*kg", "permitted_load_kg", "kg", " kg", 1.0),
+    (r"Wall\s*clearance\s*back", r"([0-9]+)\s*mm", "clearance_back_mm", "mm", " mm", 1.0),
+    (r"Wall\s*clearance\s*sidewise", r"([0-9]+)\s*mm", "clearance_side_mm", "mm", " mm", 1.0),
+)
+_CBS_DOOR_PAIRS: tuple[_CbsPair, ...] = (
+    (r"Inner\s*doors", r"([0-9]+)", "inner_doors", None, "", 1.0),
+    (r"Unit\s*doors", r"([0-9]+)", "unit_doors", None, "", 1.0),
+)
+_CBS_ENVIRONMENT_PAIRS: tuple[_CbsPair, ...] = (
+    (r"Sound-pressure\s*level", _CBS_NUM + r"\s*dB\(A\)", "noise_db_a", "dB(A)", " dB(A)", 1.0),
+    (r"Energy\s*consumption\s*at\s*37\s*°C", _CBS_NUM + r"\s*Wh/h", "energy_consumption_wh_per_h", "Wh/h", " Wh/h", 1.0),
+)
+
+
+@lru_cache(maxsize=None)
+def _pair_re(label_regex: str, value_pat: str, flags: int) -> re.Pattern[str]:
+    # 'label ... v1  v2' for the CB-S two-column layout
+    return re.compile(rf"{label_regex}\s+{value_pat}\s+{value_pat}", flags)
+
 # ----------------------------------------------------
 # Public API
 # ----------------------------------------------------
 
-def extract_products(pdf_dir: str) -> List[Dict[str, Any]]:
-    pdfs = [
-        os.path.join(pdf_dir, f)
-        for f in os.listdir(pdf_dir)
-        if f.lower().endswith(".pdf")
-    ]
+def extract_products(pdf_dir: str, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse every PDF in `pdf_dir`. Files are independent and parsing is CPU-bound
+    (pdfminer / regex), so they are spread over a process pool; `workers` defaults
+    to $PDSP_WORKERS, else os.cpu_count(). Files are taken in sorted name order (directory order is
+    arbitrary), so products and their database ids are the same on every run.
+    PDFs whose cached result is still valid are not re-parsed (see CACHE_DIRNAME).
+    """
+    with os.scandir(pdf_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.lower().endswith(".pdf") and e.is_file()),
+            key=lambda e: e.name,
+        )
+    pdfs = [e.path for e in entries]
+    cache_dir = os.path.join(pdf_dir, CACHE_DIRNAME)
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    keys: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        path = entry.path
+        keys[path] = _cache_key(entry.stat())
+        if not DISABLE_CACHE:
+            cached = _cache_load(cache_dir, path, keys[path])
+            if cached is not None:
+                results[path] = cached
+
+    todo = [p for p in pdfs if p not in results]
+    for path, result in zip(todo, _map_extract(todo, workers)):
+        results[path] = result
+        if not DISABLE_CACHE:
+            _cache_store(cache_dir, path, keys[path], result)
+
     products: List[Dict[str, Any]] = []
-    for pdf_path in pdfs:
-        text_all = _read_text_all(pdf_path)
-        kind = _classify_pdf_by_text_and_name(text_all, os.path.basename(pdf_path))
-        if kind == "binder":
-            products.extend(_parse_binder_cb_s_260(pdf_path, text_all))
-        elif kind == "techinfo":
-            products.extend(_parse_technical_info_pdf(pdf_path, text_all))
-        elif kind == "m12":
-            products.extend(_parse_m12_binder_713_763(pdf_path))
-        else:
-            # unknown -> no-op
-            pass
+    for path in pdfs:
+        products.extend(results[path])
     return products
 
+
+def _map_extract(pdfs: List[str], workers: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
+    """
+    _extract_one over `pdfs`, in order. A single file (or workers=1) is parsed in this
+    process: spawning a pool and pickling the results back would only add overhead.
+    """
+    if not pdfs:
+        return
+    workers = workers or DEFAULT_WORKERS
+    if len(pdfs) == 1 or workers == 1:
+        yield from map(_extract_one, pdfs)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(pdfs))) as ex:
+        yield from ex.map(_extract_one, pdfs)
+
+
+def _extract_one(pdf_path: str) -> List[Dict[str, Any]]:
+    """
+    A known file name (FILENAME_KINDS) settles the kind up front. Otherwise classify
+    while streaming the pages: keyword hits and ordering-code counts are accumulated
+    page by page. As soon as the remaining pages can no longer outvote "m12" the
+    scan stops and the M12 parser takes over; it reads pdfplumber text, so when that
+    is the text backend anyway the extracted pages are handed over instead of re-read.
+    """
+    name = os.path.basename(pdf_path)
+    kind = _kind_from_filename(name)
+    if kind == "m12":
+        return _parse_m12_binder_713_763(pdf_path)
+
+    if kind is not None:
+        pages = list(_iter_page_text(pdf_path))
+    else:
+        pages = []
+        present: set[str] = set()
+        n_codes = 0
+        page_iter = _iter_page_text(pdf_path)
+        for page_text in page_iter:
+            pages.append(page_text)
+            present |= _keywords_present(page_text.lower())
+            # codes only ever push towards "m12": skip counting this page if it's already settled
+            if not _m12_is_decided(present, n_codes, name):
+                n_codes += _count_ordering_codes(page_text)
+                if not _m12_is_decided(present, n_codes, name):
+                    continue
+            if fitz is None:
+                pages.extend(page_iter)
+                return _parse_m12_binder_713_763(pdf_path, pages)
+            return _parse_m12_binder_713_763(pdf_path)
+        kind = _pick_kind(_classification_scores(present, n_codes, name))
+
+    if kind == "binder":
+        return _parse_binder_cb_s_260(pdf_path, pages)
+    elif kind == "techinfo":
+        return _parse_technical_info_pdf(pdf_path, pages)
+    elif kind == "m12":
+        return _parse_m12_binder_713_763(pdf_path, pages if fitz is None else None)
+    # unknown -> no-op
+    return []
+
+# ----------------------------------------------------
+# Helpers: result cache
+# ----------------------------------------------------
+
+def _cache_key(st: os.stat_result) -> Dict[str, Any]:
+    return {
+        "version": CACHE_VERSION,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "camelot": CAMELOT_AVAILABLE,
+        "pymupdf": fitz is not None,
+    }
+
+def _cache_file(cache_dir: str, pdf_path: str) -> str:
+    return os.path.join(cache_dir, os.path.basename(pdf_path) + ".json")
+
+def _cache_load(cache_dir: str, pdf_path: str, key: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    try:
+        with open(_cache_file(cache_dir, pdf_path), "rb") as fh:
+            entry = orjson.loads(fh.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    return entry.get("products")
+
+def _cache_store(cache_dir: str, pdf_path: str, key: Dict[str, Any], products: List[Dict[str, Any]]) -> None:
+    # best effort: a read-only PDF directory just means no cache
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(_cache_file(cache_dir, pdf_path), "wb") as fh:
+            fh.write(orjson.dumps({"key": key, "products": products}))
+    except OSError:
+        pass
+
 # ----------------------------------------------------
 # Helpers: text
 # ----------------------------------------------------
 
-def _read_text_all(pdf_path: str) -> str:
+def _iter_page_text(pdf_path: str) -> Iterator[str]:
+    # PyMuPDF (C++) is much faster than pdfplumber for plain text; pdfplumber is the fallback,
+    # also for files PyMuPDF fails on. Each backend reads the whole document before anything
+    # is yielded, so a failure partway through never hands out a partial page list.
+    if fitz is not None:
+        try:
+            with fitz.open(pdf_path) as doc:
+                pages = [page.get_text("text", sort=True) for page in doc]
+        except Exception:
+            pass
+        else:
+            yield from pages
+            return
     if pdfplumber is None:
-        return ""
+        return
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            return "\n".join((p.extract_text() or "") for p in pdf.pages)
+            pages = [p.extract_text() or "" for p in pdf.pages]
     except Exception:
-        return ""
+        return
+    yield from pages
 
 def _split_pages(pdf_path: str) -> List[str]:
     if pdfplumber is None:
@@ -73,60 +363,117 @@ def _split_pages(pdf_path: str) -> List[str]:
     except Exception:
         return []
 
-def _keyword_score(text: str, positives: List[str], negatives: Optional[List[str]] = None) -> int:
-    t = text.lower()
-    score = sum(1 for k in positives if k.lower() in t)
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for k in ALL_TEXT_KEYWORDS:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _keywords_present(text_lower: str) -> set[str]:
+    """
+    Which classifier keywords occur in `text_lower`: one Aho-Corasick pass over the
+    text when pyahocorasick is installed, otherwise one substring scan per keyword.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return {k for k in ALL_TEXT_KEYWORDS if k in text_lower}
+    present: set[str] = set()
+    for _, k in _KEYWORD_AUTOMATON.iter(text_lower):
+        present.add(k)
+        if len(present) == len(ALL_TEXT_KEYWORDS):
+            break
+    return present
+
+
+def _keyword_score(present: set[str], positives: Iterable[str], negatives: Optional[Iterable[str]] = None) -> int:
+    score = sum(1 for k in positives if k in present)
     if negatives:
-        score -= sum(1 for k in negatives if k.lower() in t)
+        score -= sum(1 for k in negatives if k in present)
     return score
 
 def _count_ordering_codes(text: str) -> int:
     # matches e.g. "99 0429 14 04" and variants with optional spaces
-    return len(re.findall(r"\b(?:9\d)\s?(?:\d{3,4}\s?){2,3}\d{2}\b", text))
+    # counted off the match iterator; only the number is needed, not a list of matches.
+    # Every code starts with a 9, so a page without one is skipped without running the regex.
+    # The scores never use more than _ORDERING_CODE_CAP codes, so the scan stops there.
+    if "9" not in text:
+        return 0
+    return sum(1 for _ in islice(_ORDERING_CODE_COUNT_RE.finditer(text), _ORDERING_CODE_CAP))
+
+def _classification_scores(present: set[str], n_codes: int, filename: str) -> Dict[str, int]:
+    scores = {
+        kind: _keyword_score(present, positives, negatives=negatives)
+        for kind, (positives, negatives) in TEXT_KEYWORDS.items()
+    }
+    scores["m12"] += min(n_codes, _ORDERING_CODE_CAP)
+    scores["techinfo"] -= min(n_codes, _ORDERING_CODE_CAP)
 
-def _classify_pdf_by_text_and_name(text: str, filename: str) -> str:
     name = filename.lower()
-    s_binder = _keyword_score(text, ["binder", "cb-s", "co2", "co₂", "incubator", "model cb-s"])
-    s_m12 = _keyword_score(
-        text,
-        ["m12", "sensorik", "aktorik", "serie 713", "serie 763", "ordering-no", "ordering code", "bestell-nr."],
-        negatives=["technische information", "technische informationen", "allgemeine hinweise"],
-    )
-    s_ti = _keyword_score(
-        text,
-        ["technische information", "technische informationen", "allgemeine hinweise", "awg"],
-        negatives=["serie 713", "serie 763", "ordering-no", "ordering code", "bestell-nr.", "m12"],
+    for kind, (hints, bonus) in FILENAME_HINTS.items():
+        if any(h in name for h in hints):
+            scores[kind] += bonus
+
+    return scores
+
+# tie-break order: on equal scores the earlier kind wins
+_KIND_ORDER = ("binder", "m12", "techinfo")
+
+def _pick_kind(scores: Dict[str, int]) -> str:
+    best, best_score = "unknown", 0
+    for kind in _KIND_ORDER:
+        if scores[kind] > best_score:
+            best, best_score = kind, scores[kind]
+    return best
+
+def _m12_is_decided(present: set[str], n_codes: int, filename: str) -> bool:
+    """
+    True when no further page can change the outcome away from "m12": even if every
+    unseen m12 negative still shows up, m12 beats the best case for the other kinds
+    (every unseen positive showing up; more ordering codes only widen the gap).
+    """
+    scores = _classification_scores(present, n_codes, filename)
+    worst_m12 = scores["m12"] - sum(1 for k in TEXT_KEYWORDS["m12"][1] if k not in present)
+    best_other = max(
+        scores[kind] + sum(1 for k in positives if k not in present)
+        for kind, (positives, _) in TEXT_KEYWORDS.items()
+        if kind != "m12"
     )
-    oc = _count_ordering_codes(text)
-    s_m12 += min(oc, 100)
-    s_ti  -= min(oc, 100)
+    return worst_m12 > max(best_other, 0)
 
-    if "serie_713_763" in name or "m12" in name:
-        s_m12 += 5
-    if "technische_infos" in name or "technische_info" in name:
-        s_ti += 5
+def _kind_from_filename(filename: str) -> Optional[str]:
+    # only an unambiguous hit counts; anything else goes through text scoring
+    name = filename.lower()
+    kinds = [kind for kind, hints in FILENAME_KINDS.items() if any(h in name for h in hints)]
+    return kinds[0] if len(kinds) == 1 else None
 
-    scores = {"binder": s_binder, "m12": s_m12, "techinfo": s_ti, "unknown": 0}
-    top, top_score = max(scores.items(), key=lambda kv: kv[1])
-    return top if top_score > 0 else "unknown"
 
 # ----------------------------------------------------
 # Existing parsers (binder, techinfo)
 # ----------------------------------------------------
-def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
+def _parse_binder_cb_s_260(pdf_path: str, pages: List[str]) -> List[Dict[str, Any]]:
     """
     Parse technical information for BOTH models on the CB-S 260 data sheet:
     - CBS260-230V
     - CBS260UL-120V
     Returns two product dicts with per-model specs.
+    `pages` is the page text already extracted for classification; the sheet is
+    parsed as one text and every non-empty page counts as covered.
     """
     def norm(s: str) -> str:
-        s = s.replace("\xa0", " ")
-        s = re.sub(r"[–−—]", "-", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return " ".join(s.translate(_DASH_TABLE).split())
 
-    t = norm(text)
+    t = norm("\n".join(pages))
+    pages_covered = [n for n, page_text in enumerate(pages, start=1) if page_text.strip()]
+    source_pdf = os.path.basename(pdf_path)
+    # shared by both products; treated as read-only downstream
+    provenance = {"strategy": "binder_cb_s_260_text"}
 
     # Prepare two products
     products = {
@@ -139,9 +486,9 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             "product_name": "Model CB-S 260 | CO₂ incubator",
             "description": None,
             "interfaces": None,
-            "source_pdf": os.path.basename(pdf_path),
-            "pages_covered": [],
-            "provenance": {"strategy": "binder_cb_s_260_text"},
+            "source_pdf": source_pdf,
+            "pages_covered": list(pages_covered),
+            "provenance": provenance,
             "specs": [],
         },
         "CBS260UL-120V": {
@@ -153,9 +500,9 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             "product_name": "Model CB-S 260 | CO₂ incubator",
             "description": None,
             "interfaces": None,
-            "source_pdf": os.path.basename(pdf_path),
-            "pages_covered": [],
-            "provenance": {"strategy": "binder_cb_s_260_text"},
+            "source_pdf": source_pdf,
+            "pages_covered": list(pages_covered),
+            "provenance": provenance,
             "specs": [],
         },
     }
@@ -171,37 +518,42 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
 
     def fnum(s: str) -> float:
         s = s.replace(",", ".")
-        s = re.sub(r"[^0-9+.\-eE]", "", s)
+        s = _NON_FLOAT_CHARS_RE.sub("", s)
         return float(s)
 
     # ---------------------- Header mappings ----------------------
     # Article numbers
-    m = re.search(r"Article\s*Number\s+(\d{4}-\d{4})\s+(\d{4}-\d{4})", t, re.I)
+    m = _CBS_ARTICLE_RE.search(t)
     if m:
         products["CBS260-230V"]["article_number"] = m.group(1)
         products["CBS260UL-120V"]["article_number"] = m.group(2)
 
     # ---------------------- Helper to capture pair values ----------------------
-    def pair_numbers(label_regex: str, value_pat: str, flags=re.I | re.S) -> tuple[str, str] | None:
+    def pair_numbers(label_regex: str, value_pat: str, flags=re.I | re.S | re.ASCII) -> tuple[str, str] | None:
         """
         Find 'label ... v1  v2' where each value matches value_pat.
         Returns raw strings (v1, v2) or None.
         """
-        pat = rf"{label_regex}\s+{value_pat}\s+{value_pat}"
-        m = re.search(pat, t, flags)
+        m = _pair_re(label_regex, value_pat, flags).search(t)
         if not m:
             return None
         # two capturing groups expected
         return (m.group(1), m.group(2))
 
+    def add_pairs(rows: Iterable[_CbsPair]) -> None:
+        # one spec per model from each 'label  v1  v2' row that is present (see _CbsPair)
+        for label_regex, value_pat, key, unit, raw_suffix, scale in rows:
+            m = pair_numbers(label_regex, value_pat)
+            if not m:
+                continue
+            for model, v in zip(products, m):
+                if scale is None:
+                    add(model, key, text=v, raw=v)
+                else:
+                    add(model, key, num=fnum(v) * scale, unit=unit, raw=v + raw_suffix)
+
     # ---------- Temperature range (+6 °C above ambient temperature to 50 °C) ----------
-    m = re.search(
-        r"Temperature\s*range\s+"
-        r"\+?\s*([0-9]+(?:[.,][0-9]+)?)\s*°C\s*above\s*ambient(?:\s*temperature)?"
-        r"\s*(?:to|–|-|…)\s*([0-9]+(?:[.,][0-9]+)?)\s*°C",
-        t,
-        re.I,
-    )
+    m = _CBS_TEMP_RANGE_RE.search(t)
     if m:
         lo = fnum(m.group(1))
         hi = fnum(m.group(2))
@@ -210,31 +562,12 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             add(model, "temp_max_c", num=hi, unit="°C", raw=m.group(0))
 
 
-    # Uniformity / fluctuation @37°C (format like "0.4 ± K")
-    m = pair_numbers(r"Temperature\s*uniformity\s*at\s*37\s*°C", r"([0-9]+(?:[.,][0-9]+)?)\s*±\s*K")
-    if m:
-        add("CBS260-230V", "temp_uniformity_c", num=fnum(m[0]), unit="°C", raw=m[0] + " ±K")
-        add("CBS260UL-120V", "temp_uniformity_c", num=fnum(m[1]), unit="°C", raw=m[1] + " ±K")
-
-    m = pair_numbers(r"Temperature\s*fluctuation\s*at\s*37\s*°C", r"([0-9]+(?:[.,][0-9]+)?)\s*±\s*K")
-    if m:
-        add("CBS260-230V", "temp_fluctuation_c", num=fnum(m[0]), unit="°C", raw=m[0] + " ±K")
-        add("CBS260UL-120V", "temp_fluctuation_c", num=fnum(m[1]), unit="°C", raw=m[1] + " ±K")
-
-    m = pair_numbers(r"Recovery\s*time\s*after\s*door\s*was\s*opened\s*for\s*30\s*s\s*at\s*37\s*°C", r"([0-9]+(?:[.,][0-9]+)?)\s*min")
-    if m:
-        add("CBS260-230V", "temp_recovery_min", num=fnum(m[0]), unit="min", raw=m[0] + " min")
-        add("CBS260UL-120V", "temp_recovery_min", num=fnum(m[1]), unit="min", raw=m[1] + " min")
+    # Uniformity / fluctuation @37°C (format like "0.4 ± K"), recovery time
+    add_pairs(_CBS_TEMPERATURE_PAIRS)
 
         # ---------- Climate ----------
     # Humidity range 90 ...95 % RH  90 ...95 % RH
-    m = re.search(
-        r"Humidity\s*range\s+"
-        r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*%\s*RH\s+"
-        r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*%\s*RH",
-        t,
-        re.I,
-    )
+    m = _CBS_HUMIDITY_RE.search(t)
     if m:
         lo1, hi1, lo2, hi2 = m.groups()
         raw_h = m.group(0)
@@ -246,13 +579,7 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
 
     # ---------- CO₂ ----------
     # CO₂ range 0 ...20 Vol.-% CO2   0 ...20 Vol.-% CO2
-    m = re.search(
-        r"CO[₂2]\s*range\s+"
-        r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*(?:Vol\.-?%|%)\s*CO2?\s+"
-        r"([0-9]+(?:[.,][0-9]+)?)\s*\.\.\.\s*([0-9]+(?:[.,][0-9]+)?)\s*(?:Vol\.-?%|%)\s*CO2?",
-        t,
-        re.I,
-    )
+    m = _CBS_CO2_RANGE_RE.search(t)
     if m:
         lo1, hi1, lo2, hi2 = m.groups()
         raw_co2 = m.group(0)
@@ -262,26 +589,17 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
         add("CBS260UL-120V", "co2_max_pct", num=fnum(hi2), unit="%", raw=raw_co2)
 
 
-    m = pair_numbers(r"CO[₂2]\s*measuring\s*technology", r"(IR|NDIR)")
-    if m:
-        add("CBS260-230V", "co2_sensor", text=m[0], raw=m[0])
-        add("CBS260UL-120V", "co2_sensor", text=m[1], raw=m[1])
+    add_pairs(_CBS_CO2_PAIRS)
 
     # CO₂ recovery time (label split over two lines in some PDFs)
-    m = re.search(r"CO[₂2]\s*recovery\s*time.*?for\s*30\s*s.*?(?:\r?\n)?\s*([0-9]+(?:[.,][0-9]+)?)\s*min\s+([0-9]+(?:[.,][0-9]+)?)\s*min", t, re.I | re.S)
+    m = _CBS_CO2_RECOVERY_RE.search(t)
     if m:
         add("CBS260-230V", "co2_recovery_min", num=fnum(m.group(1)), unit="min", raw=m.group(0))
         add("CBS260UL-120V", "co2_recovery_min", num=fnum(m.group(2)), unit="min", raw=m.group(0))
 
     # ---------- Electrical ----------
     # Rated Voltage 200...230 V 100...120 V
-    m = re.search(
-        r"Rated\s*Voltage\s+"
-        r"([0-9]{2,3})\s*\.\.\.\s*([0-9]{2,3})\s*V\s+"
-        r"([0-9]{2,3})\s*\.\.\.\s*([0-9]{2,3})\s*V",
-        t,
-        re.I,
-    )
+    m = _CBS_RATED_VOLTAGE_RE.search(t)
     if m:
         lo1, hi1, lo2, hi2 = m.groups()
         raw_rv = m.group(0)
@@ -290,69 +608,17 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
         add("CBS260UL-120V", "supply_voltage_min_v", num=fnum(lo2), unit="V", raw=raw_rv)
         add("CBS260UL-120V", "supply_voltage_max_v", num=fnum(hi2), unit="V", raw=raw_rv)
 
-    m = pair_numbers(r"Power\s*frequency", r"(50/60|50|60)\s*Hz")
-    if m:
-        add("CBS260-230V", "supply_freq_hz", text=m[0].replace(" ", ""), raw=m[0])
-        add("CBS260UL-120V", "supply_freq_hz", text=m[1].replace(" ", ""), raw=m[1])
-
-    m = pair_numbers(r"Nominal\s*power", r"([0-9]+(?:[.,][0-9]+)?)\s*kW")
-    if m:
-        add("CBS260-230V", "nominal_power_w", num=fnum(m[0])*1000.0, unit="W", raw=m[0] + " kW")
-        add("CBS260UL-120V", "nominal_power_w", num=fnum(m[1])*1000.0, unit="W", raw=m[1] + " kW")
-
-    m = pair_numbers(r"Unit\s*fuse", r"([0-9]+(?:[.,][0-9]+)?)\s*A")
-    if m:
-        add("CBS260-230V", "unit_fuse_a", num=fnum(m[0]), unit="A", raw=m[0]+" A")
-        add("CBS260UL-120V", "unit_fuse_a", num=fnum(m[1]), unit="A", raw=m[1]+" A")
-
-    m = pair_numbers(r"Phase\s*\(Nominal\s*voltage\)", r"([0-9]~)")
-    if m:
-        add("CBS260-230V", "phase", text=m[0], raw=m[0])
-        add("CBS260UL-120V", "phase", text=m[1], raw=m[1])
+    add_pairs(_CBS_ELECTRICAL_PAIRS)
 
     # ---------- Measures / dimensions / weights ----------
-    m = pair_numbers(r"Interior\s*volume", r"([0-9]+(?:[.,][0-9]+)?)\s*L")
-    if m:
-        add("CBS260-230V", "interior_volume_l", num=fnum(m[0]), unit="L", raw=m[0]+" L")
-        add("CBS260UL-120V", "interior_volume_l", num=fnum(m[1]), unit="L", raw=m[1]+" L")
-
-    m = pair_numbers(r"Net\s*weight.*?unit.*?\(empty\)", r"([0-9]+(?:[.,][0-9]+)?)\s*kg")
-    if m:
-        add("CBS260-230V", "weight_kg", num=fnum(m[0]), unit="kg", raw=m[0]+" kg")
-        add("CBS260UL-120V", "weight_kg", num=fnum(m[1]), unit="kg", raw=m[1]+" kg")
-
-    m = pair_numbers(r"Load\s*per\s*rack", r"([0-9]+(?:[.,][0-9]+)?)\s*kg")
-    if m:
-        add("CBS260-230V", "shelf_max_load_kg", num=fnum(m[0]), unit="kg", raw=m[0]+" kg")
-        add("CBS260UL-120V", "shelf_max_load_kg", num=fnum(m[1]), unit="kg", raw=m[1]+" kg")
-
-    m = pair_numbers(r"Permitted\s*load", r"([0-9]+(?:[.,][0-9]+)?)\s*kg")
-    if m:
-        add("CBS260-230V", "permitted_load_kg", num=fnum(m[0]), unit="kg", raw=m[0]+" kg")
-        add("CBS260UL-120V", "permitted_load_kg", num=fnum(m[1]), unit="kg", raw=m[1]+" kg")
-
-    m = pair_numbers(r"Wall\s*clearance\s*back", r"([0-9]+)\s*mm")
-    if m:
-        add("CBS260-230V", "clearance_back_mm", num=fnum(m[0]), unit="mm", raw=m[0]+" mm")
-        add("CBS260UL-120V", "clearance_back_mm", num=fnum(m[1]), unit="mm", raw=m[1]+" mm")
-
-    m = pair_numbers(r"Wall\s*clearance\s*sidewise", r"([0-9]+)\s*mm")
-    if m:
-        add("CBS260-230V", "clearance_side_mm", num=fnum(m[0]), unit="mm", raw=m[0]+" mm")
-        add("CBS260UL-120V", "clearance_side_mm", num=fnum(m[1]), unit="mm", raw=m[1]+" mm")
+    add_pairs(_CBS_MEASURE_PAIRS)
 
     # ---------- External dimensions from Width/Height/Depth net ----------
     # Lines look like:
     # Width net 740 mm 740 mm
     # Height net 1,020 mm 1,020 mm
     # Depth net 785 mm 785 mm
-    m = re.search(
-        r"Width\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm.*?"
-        r"Height\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm.*?"
-        r"Depth\s*net\s+([0-9]{2,4}[0-9,]*)\s*mm\s+([0-9]{2,4}[0-9,]*)\s*mm",
-        t,
-        re.I | re.S,
-    )
+    m = _CBS_EXTERNAL_DIMS_RE.search(t)
     if m:
         w1, w2, h1, h2, d1, d2 = m.groups()
         dims1 = f"{int(fnum(w1))}×{int(fnum(h1))}×{int(fnum(d1))} mm"
@@ -371,15 +637,7 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             add(model, "interior_dimensions_mm", text=dims, raw=dims)
 
     # Doors / fixtures / shelves
-    m = pair_numbers(r"Inner\s*doors", r"([0-9]+)")
-    if m:
-        add("CBS260-230V", "inner_doors", num=fnum(m[0]), raw=m[0])
-        add("CBS260UL-120V", "inner_doors", num=fnum(m[1]), raw=m[1])
-
-    m = pair_numbers(r"Unit\s*doors", r"([0-9]+)")
-    if m:
-        add("CBS260-230V", "unit_doors", num=fnum(m[0]), raw=m[0])
-        add("CBS260UL-120V", "unit_doors", num=fnum(m[1]), raw=m[1])
+    add_pairs(_CBS_DOOR_PAIRS)
 
     # Shelves std/max "2/8"
     m = pair_numbers(r"Number\s*of\s*shelves.*?\(std\.\s*/\s*max\.\)", r"([0-9]+/[0-9]+)")
@@ -390,38 +648,41 @@ def _parse_binder_cb_s_260(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             add(model, "shelves_max", num=fnum(mx), raw=m[ix])
 
     # Environment / energy / sound
-    m = pair_numbers(r"Sound-pressure\s*level", r"([0-9]+(?:[.,][0-9]+)?)\s*dB\(A\)")
-    if m:
-        add("CBS260-230V", "noise_db_a", num=fnum(m[0]), unit="dB(A)", raw=m[0]+" dB(A)")
-        add("CBS260UL-120V", "noise_db_a", num=fnum(m[1]), unit="dB(A)", raw=m[1]+" dB(A)")
-
-    m = pair_numbers(r"Energy\s*consumption\s*at\s*37\s*°C", r"([0-9]+(?:[.,][0-9]+)?)\s*Wh/h")
-    if m:
-        add("CBS260-230V", "energy_consumption_wh_per_h", num=fnum(m[0]), unit="Wh/h", raw=m[0]+" Wh/h")
-        add("CBS260UL-120V", "energy_consumption_wh_per_h", num=fnum(m[1]), unit="Wh/h", raw=m[1]+" Wh/h")
+    add_pairs(_CBS_ENVIRONMENT_PAIRS)
 
     # Return both products
     return [products["CBS260-230V"], products["CBS260UL-120V"]]
 
-def _parse_technical_info_pdf(pdf_path: str, text: str) -> List[Dict[str, Any]]:
+def _min_max(values: Iterable[float]) -> Optional[tuple[float, float]]:
+    # min and max in one pass over a (lazy) iterable; None when it is empty
+    lo = hi = None
+    for v in values:
+        if lo is None:
+            lo = hi = v
+        elif v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return None if lo is None else (lo, hi)
+
+def _parse_technical_info_pdf(pdf_path: str, pages: List[str]) -> List[Dict[str, Any]]:
     """
     Parse Binder M12 technical information page:
     Creates one virtual product per coding:
       M12-A, M12-B, M12-D, M12-X, M12-S, M12-K, M12-T, M12-L, M12-US-C
     Only technical fields: current, voltage, IP, contacts, application.
+    `pages` is the page text already extracted for classification; each coding
+    records the page(s) its header and value line were found on.
     """
     def norm(s: str) -> str:
-        s = s.replace("\xa0", " ")
-        s = re.sub(r"[–−—]", "-", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return " ".join(s.translate(_DASH_TABLE).split())
 
     def parse_coding_row(line: str) -> Dict[str, Any]:
         line = norm(line)
         out: Dict[str, Any] = {}
 
         # --- IP block ---
-        ip_match = re.search(r"IP\d+[0-9K]?(?:\s*/\s*IP\d+[0-9K]?)*", line)
+        ip_match = _TI_IP_RE.search(line)
         if ip_match:
             ip_raw = norm(ip_match.group(0))
             out["ip_rating"] = ip_raw
@@ -432,40 +693,38 @@ def _parse_technical_info_pdf(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             right = ""
 
         # --- current & voltage (left side) ---
-        curr_match = re.match(r"([0-9.,\s/\-]+A(?:\s*/\s*[0-9.,\s]+A)*)\s*(.*)", left)
+        curr_match = _TI_CURRENT_RE.match(left)
         volt_part = ""
         if curr_match:
             curr_part = curr_match.group(1).strip()
             volt_part = curr_match.group(2).strip()
-            curr_nums = [float(n.replace(",", ".")) for n in re.findall(r"\d+(?:[.,]\d+)?", curr_part)]
-            if curr_nums:
-                out["current_min_a"] = min(curr_nums)
-                out["current_max_a"] = max(curr_nums)
+            curr_range = _min_max(float(m.group(0).replace(",", ".")) for m in _DECIMAL_RE.finditer(curr_part))
+            if curr_range:
+                out["current_min_a"], out["current_max_a"] = curr_range
                 out["current_raw"] = curr_part
         else:
             volt_part = left.strip()
 
         if volt_part:
-            v_nums = [float(n.replace(",", ".")) for n in re.findall(r"\d+(?:[.,]\d+)?", volt_part)]
-            if v_nums:
-                out["voltage_min_v"] = min(v_nums)
-                out["voltage_max_v"] = max(v_nums)
+            v_range = _min_max(float(m.group(0).replace(",", ".")) for m in _DECIMAL_RE.finditer(volt_part))
+            if v_range:
+                out["voltage_min_v"], out["voltage_max_v"] = v_range
                 out["voltage_raw"] = volt_part
-            if "dc" in volt_part.lower():
+            volt_lower = volt_part.lower()
+            if "dc" in volt_lower:
                 out["voltage_dc"] = True
-            if "ac" in volt_part.lower():
+            if "ac" in volt_lower:
                 out["voltage_ac"] = True
 
         # --- contacts & application (right side) ---
         if right:
-            m_ct = re.match(r"([0-9+\-PEF,\s]+)", right)
+            m_ct = _TI_CONTACTS_RE.match(right)
             if m_ct:
                 contacts_txt = m_ct.group(1).strip()
                 out["contacts_text"] = contacts_txt
-                nums = [int(n) for n in re.findall(r"\d+", contacts_txt)]
-                if nums:
-                    out["contacts_min"] = min(nums)
-                    out["contacts_max"] = max(nums)
+                ct_range = _min_max(int(m.group(0)) for m in _DIGITS_RE.finditer(contacts_txt))
+                if ct_range:
+                    out["contacts_min"], out["contacts_max"] = ct_range
                 app = right[m_ct.end():].strip()
             else:
                 app = right.strip()
@@ -474,12 +733,22 @@ def _parse_technical_info_pdf(pdf_path: str, text: str) -> List[Dict[str, Any]]:
 
         return out
 
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    lines: List[str] = []
+    line_pages: List[int] = []
+    for page_no, page_text in enumerate(pages, start=1):
+        for l in page_text.splitlines():
+            l = l.strip()
+            if l:
+                lines.append(l)
+                line_pages.append(page_no)
     results: List[Dict[str, Any]] = []
+    source_pdf = os.path.basename(pdf_path)
+    # shared by every coding product; treated as read-only downstream
+    provenance = {"strategy": "m12_technical_info"}
 
     i = 0
     while i < len(lines):
-        m = re.match(r"M12\s+(.+?)-KODIERUNG", lines[i], flags=re.I)
+        m = _TI_CODING_HEADER_RE.match(lines[i])
         if not m:
             i += 1
             continue
@@ -552,9 +821,9 @@ def _parse_technical_info_pdf(pdf_path: str, text: str) -> List[Dict[str, Any]]:
             "product_name": f"M12 {coding_label}-coding",
             "description": None,
             "interfaces": None,
-            "source_pdf": os.path.basename(pdf_path),
-            "pages_covered": [1],
-            "provenance": {"strategy": "m12_technical_info"},
+            "source_pdf": source_pdf,
+            "pages_covered": sorted({line_pages[i], line_pages[j + 1]}),
+            "provenance": provenance,
             "specs": specs,
         })
 
@@ -567,15 +836,25 @@ def _parse_technical_info_pdf(pdf_path: str, text: str) -> List[Dict[str, Any]]:
 # NEW: M12 713/763 parser
 # ----------------------------------------------------
 
-def _parse_m12_binder_713_763(pdf_path: str) -> List[Dict[str, Any]]:
-    pages = _split_pages(pdf_path)
+def _parse_m12_binder_713_763(pdf_path: str, pages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    # `pages`: pdfplumber page texts the caller already has (same as _split_pages)
+    if pages is None:
+        pages = _split_pages(pdf_path)
     out: List[Dict[str, Any]] = []
-    for idx, page_text in enumerate(pages):
-        if not _page_looks_like_m12(page_text):
-            continue
+    source_pdf = os.path.basename(pdf_path)
+    # label from find_spec: importing camelot (pandas, OpenCV) is left to pages that need tables
+    strategy = "m12_camelot_or_regex" if CAMELOT_AVAILABLE else "m12_page_regex"
+    # both page predicates match lowercase words; lower each page once for the two of them
+    lowered = [(page_text or "").lower() for page_text in pages]
+    m12_pages = [idx for idx, low in enumerate(lowered) if _page_looks_like_m12(low)]
+    tables_by_page = _camelot_tables_by_page(
+        pdf_path, [idx + 1 for idx in m12_pages if _page_has_ordering_table(lowered[idx])]
+    )
+    for idx in m12_pages:
+        page_text = pages[idx]
 
         page_desc = _extract_variant_description(page_text)
-        small_table_rows = _extract_small_tables(page_text, pdf_path, idx)
+        small_table_rows = _extract_small_tables(page_text, tables_by_page.get(idx + 1))
         
         if not small_table_rows:
             continue
@@ -588,6 +867,21 @@ def _parse_m12_binder_713_763(pdf_path: str) -> List[Dict[str, Any]]:
         # build spec map: {contact_count: {spec_key: english_value}}
         contact_spec_map = build_contact_value_map(page_text, page_contacts)
 
+        # shared by every product from this page; treated as read-only downstream
+        page_provenance = {"strategy": strategy, "page": idx + 1}
+        # page-level ip / temp: the same page text for every row, so parsed once per page
+        page_specs: List[Dict[str, Any]] = []
+        ip = parse_ip_code(page_text)
+        if ip:
+            page_specs.append({"spec_key": "ip_rating", "spec_value_text": ip, "raw": ip})
+        tmin, tmax = parse_temp_block(page_text)
+        if tmax is not None:
+            page_specs.append({"spec_key": "temp_max_c", "spec_value_num": tmax, "unit": "°C", "raw": str(tmax)})
+        if tmin is not None:
+            page_specs.append({"spec_key": "temp_min_c", "spec_value_num": tmin, "unit": "°C", "raw": str(tmin)})
+        # contacts -> its big-table spec dicts, built once per page (shared, read-only too)
+        contact_spec_rows: Dict[Optional[int], List[Dict[str, Any]]] = {}
+
         for row in small_table_rows:
             contacts = row.get("contacts")
             cable_outlet = row.get("cable_outlet")
@@ -608,28 +902,19 @@ def _parse_m12_binder_713_763(pdf_path: str) -> List[Dict[str, Any]]:
                 specs.append({"spec_key": "contacts", "spec_value_num": float(contacts), "raw": str(contacts)})
 
             # merge shared specs
-            # page-level ip / temp
-            ip = parse_ip_code(page_text)
-            if ip:
-                specs.append({"spec_key": "ip_rating", "spec_value_text": ip, "raw": ip})
-
-            tmin, tmax = parse_temp_block(page_text)
-            if tmax is not None:
-                specs.append({"spec_key": "temp_max_c", "spec_value_num": tmax, "unit": "°C", "raw": str(tmax)})
-            if tmin is not None:
-                specs.append({"spec_key": "temp_min_c", "spec_value_num": tmin, "unit": "°C", "raw": str(tmin)})
+            specs.extend(page_specs)
 
             # contact-specific specs from big table
             if contact_spec_map:
-                contact_specs = contact_spec_map.get(contacts, contact_spec_map.get(0, {}))
-                for k, v in contact_specs.items():
-                    if not v:
-                        continue
-                    specs.append({
-                        "spec_key": k,
-                        "spec_value_text": v,
-                        "raw": v,
-                    })
+                shared_specs = contact_spec_rows.get(contacts)
+                if shared_specs is None:
+                    contact_specs = contact_spec_map.get(contacts, contact_spec_map.get(0, {}))
+                    shared_specs = contact_spec_rows[contacts] = [
+                        {"spec_key": k, "spec_value_text": v, "raw": v}
+                        for k, v in contact_specs.items()
+                        if v
+                    ]
+                specs.extend(shared_specs)
 
             # dedupe specs
             seen = set()
@@ -652,12 +937,9 @@ def _parse_m12_binder_713_763(pdf_path: str) -> List[Dict[str, Any]]:
                 "product_name": "M12 connector (variant)",
                 "description": page_desc,
                 "interfaces": None,
-                "source_pdf": os.path.basename(pdf_path),
+                "source_pdf": source_pdf,
                 "pages_covered": [idx + 1],
-                "provenance": {
-                    "strategy": "m12_page_regex" if camelot is None else "m12_camelot_or_regex",
-                    "page": idx + 1
-                },
+                "provenance": page_provenance,
                 "specs": specs,
             })
     return out
@@ -666,45 +948,87 @@ def _parse_m12_binder_713_763(pdf_path: str) -> List[Dict[str, Any]]:
 # M12 Helpers
 # ----------------------------------------------------
 
-def _page_looks_like_m12(text: str) -> bool:
-    t = (text or "").lower()
+def _page_looks_like_m12(t: str) -> bool:
+    # `t` is the page text already lowercased by the caller
     has_table_hdr = (("polzahl" in t or "contacts" in t) and ("bestell" in t or "ordering-no" in t or "ordering no" in t))
     return "m12" in t and has_table_hdr
 
 
 def _extract_variant_description(text: str) -> Optional[str]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    for ln in lines[:80]:
+    # only the first 80 non-empty lines are considered; don't strip the rest of the page
+    lines = (ln for ln in map(str.strip, text.splitlines()) if ln)
+    for ln in islice(lines, 80):
+        # descriptions are comma-separated; test that before lowercasing the line
+        if "," not in ln:
+            continue
         low = ln.lower()
         # Prefer obvious English descriptors
-        if any(w in low for w in ("male", "female", "connector", "angled")) and "," in ln:
+        if any(w in low for w in ("male", "female", "connector", "angled")):
             # NEW: keep only ASCII to avoid German leakage; collapse spaces
-            en = re.sub(r"[^\x20-\x7E]+", " ", ln)
-            en = re.sub(r"\s+", " ", en).strip()
+            en = _NON_ASCII_RE.sub(" ", ln)
+            en = _WS_RE.sub(" ", en).strip()
             return en if en else ln
     return None
 
 
-def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=None)
+def _camelot():
+    # the camelot module, or None when disabled / not installed / failing to import
+    if not CAMELOT_AVAILABLE:
+        return None
+    try:
+        import camelot
+    except Exception:
+        return None
+    return camelot
+
+
+def _page_has_ordering_table(t: str) -> bool:
+    # the header words _extract_small_tables looks for in a camelot table; pages without
+    # them can't yield rows there, so camelot isn't run on them at all (`t` is lowercased)
+    return ("contacts" in t and "cable" in t and "ordering" in t) or \
+           ("polzahl" in t and "kabeldurchlass" in t and "bestell" in t)
+
+
+def _camelot_tables_by_page(pdf_path: str, page_numbers: List[int]) -> Dict[int, List[Any]]:
+    """
+    Camelot tables for the given 1-based pages, grouped by page. One read_pdf call for
+    all of them: every call re-opens and re-parses the whole PDF.
     """
-    Prefer Camelot if available; otherwise use regex to pair rows like:
+    by_page: Dict[int, List[Any]] = collections.defaultdict(list)
+    if not page_numbers:
+        return by_page
+    camelot = _camelot()
+    if camelot is None:
+        return by_page
+    try:
+        for tbl in camelot.read_pdf(pdf_path, pages=",".join(map(str, page_numbers)), flavor="stream"):
+            by_page[int(tbl.page)].append(tbl)
+    except Exception:
+        pass
+    return by_page
+
+
+def _extract_small_tables(page_text: str, tables: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Prefer the page's Camelot `tables` if there are any; otherwise use regex to pair rows like:
       Contacts: 4
       Cable outlet: 4–6 mm
       Ordering-No.: 99 0429 14 04
     """
     rows: List[Dict[str, Any]] = []
 
-    if camelot is not None:
+    if tables:
         try:
-            tables = camelot.read_pdf(pdf_path, pages=str(page_index + 1), flavor="stream")
             for tbl in tables:
-                df = tbl.df
-                headers = " ".join(df.iloc[0].astype(str).tolist()).lower()
+                # Table.data: the cell strings as plain nested lists (what tbl.df is built from)
+                data = tbl.data
+                headers = " ".join(str(c) for c in data[0]).lower()
                 if ("contacts" in headers and "cable" in headers and "ordering" in headers) or \
                    ("polzahl" in headers and "kabeldurchlass" in headers and "bestell" in headers):
                     # normalize rows
-                    for r in range(1, len(df)):
-                        cells = [c.strip() for c in df.iloc[r].astype(str).tolist()]
+                    for row in data[1:]:
+                        cells = [str(c).strip() for c in row]
                         if len(cells) < 3:
                             continue
                         cts = _coerce_int(cells[0])
@@ -715,12 +1039,7 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
         except Exception:
             pass
 
-    # Fallback (or supplement): regex extraction from text block
-    # 1) chunk by occurrence of the headers
-        # Fallback (or supplement): line-based parser for side-by-side small tables
-        # Fallback (text-only): parse side-by-side small tables using local windows
-        # Fallback: robust line-based parser for 1..N side-by-side ordering tables
-        # Fallback: robust line-based parser for 1..N side-by-side ordering tables
+    # Fallback (text-only): line-based parser for 1..N side-by-side ordering tables
     if not rows:
         lines = page_text.splitlines()
 
@@ -737,10 +1056,6 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
         if start is None or end is None or end <= start:
             return rows
 
-        mm_code_pattern = re.compile(
-            r"([0-9,.\-–]+\s*mm)\s+((?:9\d)(?:\s?\d+){3,4})"
-        )
-
         rows = []
         current_contacts: list[int] = []
         i = start
@@ -750,18 +1065,20 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
                 i += 1
                 continue
 
-            # pure contacts line: "3", "4 5 8 12", etc.
-            if re.fullmatch(r"(?:\d+\s+)+\d+", ln):
-                current_contacts = [int(x) for x in ln.split()]
+            # pure contacts line: "3 4", "4 5 8 12", etc.
+            nums = _contacts_line_numbers(ln)
+            if nums:
+                current_contacts = nums
                 i += 1
                 continue
 
             # find one or more "<mm> <order>" pairs on this line
-            pairs = mm_code_pattern.findall(ln)
+            # (the pair pattern needs a literal "mm"; most lines are rejected by the substring test)
+            pairs = _MM_ORDER_PAIR_RE.findall(ln) if "mm" in ln else []
             if pairs:
                 # inline contacts at start of line, e.g. "5 6–8 mm 99 0487 12 08"
                 inline_nums: list[int] = []
-                m_inline = re.match(r"((?:\d+\s+)+)([0-9,.\-–]+\s*mm)\s+((?:9\d)(?:\s?\d+){3,4})", ln)
+                m_inline = _INLINE_CONTACTS_PAIR_RE.match(ln)
                 if m_inline:
                     inline_nums = [int(x) for x in m_inline.group(1).split()]
 
@@ -769,9 +1086,7 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
                 # if no inline and no current, treat next pure-digits line as contacts for this line
                 # if next line is pure digits, treat it as contacts for THIS line
                 if i + 1 < end:
-                    nxt = lines[i + 1].strip()
-                    if re.fullmatch(r"(?:\d+\s+)+\d+", nxt):
-                        lookahead_nums = [int(x) for x in nxt.split()]
+                    lookahead_nums = _contacts_line_numbers(lines[i + 1].strip())
 
 
                 def pick_contacts() -> list[int]:
@@ -815,10 +1130,15 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
     # ---- post-process: fill missing contacts by nearest contact anchor ----
     if rows:
         # collect standalone contact anchor lines and their char positions
+        # (finditer yields them in text order, so anchor_offsets is sorted for bisect)
         contact_anchors = []
-        for m in re.finditer(r'(?m)^\s*(\d{1,2}(?:\s+\d{1,2})*)\s*$', page_text):
-            nums = [int(x) for x in re.findall(r'\d{1,2}', m.group(1))]
+        for m in _CONTACT_ANCHOR_RE.finditer(page_text):
+            nums = [int(x) for x in _CONTACT_NUM_RE.findall(m.group(1))]
             contact_anchors.append((m.start(), nums))
+        anchor_offsets = [a[0] for a in contact_anchors]
+        # anchor index -> {compact ordering code: first position} for the ±400 char window
+        # around that anchor; many rows share an anchor, so each window is scanned once
+        orders_near_anchor: Dict[int, Dict[str, int]] = {}
 
         # assign missing contacts by finding the nearest anchor to the ordering code
         for row in rows:
@@ -843,7 +1163,8 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
 
 
             if pos != -1 and contact_anchors:
-                nearest = min(contact_anchors, key=lambda a: abs(a[0] - pos))
+                nearest_idx = _nearest_index(anchor_offsets, pos)
+                nearest = contact_anchors[nearest_idx]
                 nums = nearest[1]
                 if len(nums) == 1:
                     chosen = nums[0]
@@ -851,18 +1172,19 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
                     # If anchor has multiple numbers (e.g. "3 4 5 8 12"),
                     # try to be smarter: map by pair-index on same line if possible.
                     # Find all ordering codes on that anchor's surrounding area:
-                    anchor_pos = nearest[0]
-                    window = page_text[max(0, anchor_pos - 400): anchor_pos + 400]
-                    # build list of ordering codes (compact) found in the window
-                    found_orders = [o.replace(" ", "") for o in re.findall(r"(?:9\d)(?:\s?\d+){3,4}", window)]
-                    if found_orders:
-                        # try to find this row's ordering within the found orders to get an index
-                        try:
-                            idx = found_orders.index(ordering)
-                            # clamp idx to nums length
-                            chosen = nums[min(idx, len(nums) - 1)]
-                        except ValueError:
-                            chosen = nums[0]
+                    found_orders = orders_near_anchor.get(nearest_idx)
+                    if found_orders is None:
+                        anchor_pos = nearest[0]
+                        window = page_text[max(0, anchor_pos - 400): anchor_pos + 400]
+                        found_orders = {}
+                        for k, o in enumerate(_LOOSE_ORDER_RE.findall(window)):
+                            found_orders.setdefault(o.replace(" ", ""), k)
+                        orders_near_anchor[nearest_idx] = found_orders
+                    # try to find this row's ordering within the found orders to get an index
+                    idx = found_orders.get(ordering)
+                    if idx is not None:
+                        # clamp idx to nums length
+                        chosen = nums[min(idx, len(nums) - 1)]
                     else:
                         chosen = nums[0]
                 row["contacts"] = int(chosen)
@@ -887,7 +1209,7 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
 
     # learn from lines that explicitly begin with a contact number and contain an ordering code
     for line in page_text.splitlines():
-        m = re.match(r"\s*(\d{1,2})\s+.*?(?:9\d)\s+(\d+)\s+(\d+)\s+\d{2}\b", line)
+        m = _CONTACT_PREFIXED_ORDER_RE.match(line)
         if m:
             c = int(m.group(1))
             g2 = m.group(2)  # series block (e.g., 0429 / 0437 / 0487 / 0491)
@@ -895,10 +1217,21 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
             g2g3_to_contact[(g2, g3)] = c
             g2_counts[g2][c] += 1
 
+    # fallback per series (g2): its most common contact, decided once rather than per row;
+    # only the top two counts matter, so most_common(2) instead of sorting every count
+    g2_fallback: dict[str, int] = {}
+    for g2, counts in g2_counts.items():
+        common = counts.most_common(2)
+        if len(common) > 1 and common[0][1] == common[1][1]:
+            # tie-break preference for 4 if present (avoids mis-mapping 04 -> 3 on this layout)
+            g2_fallback[g2] = 4 if 4 in counts else common[0][0]
+        else:
+            g2_fallback[g2] = common[0][0]
+
     # override/complete per-row contacts using the learned map
     for r in rows:
         oc = r.get("ordering_code") or ""
-        m = re.search(r"(?:9\d)\s+(\d+)\s+(\d+)\s+(\d{2})\b", oc)
+        m = _ORDERING_CODE_GROUPS_RE.search(oc)
         if not m:
             continue
         g2, g3 = m.group(1), m.group(2)
@@ -909,13 +1242,8 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
             continue
 
         # fallback: choose the most common contact seen for this series (g2)
-        if g2 in g2_counts and g2_counts[g2]:
-            common = g2_counts[g2].most_common()
-            if len(common) > 1 and common[0][1] == common[1][1]:
-                # tie-break preference for 4 if present (avoids mis-mapping 04 -> 3 on this layout)
-                r["contacts"] = 4 if 4 in g2_counts[g2] else common[0][0]
-            else:
-                r["contacts"] = common[0][0]
+        if g2 in g2_fallback:
+            r["contacts"] = g2_fallback[g2]
     # --- end second-pass ---
 
     # de-dup
@@ -930,11 +1258,34 @@ def _extract_small_tables(page_text: str, pdf_path: str, page_index: int) -> Lis
     return uniq
 
 
+def _contacts_line_numbers(line: str) -> List[int]:
+    # a stripped line of two or more whitespace-separated numbers ("4 5 8 12"), else [];
+    # isdecimal() is the same character class as the regex \d
+    parts = line.split()
+    if len(parts) < 2 or not all(p.isdecimal() for p in parts):
+        return []
+    return [int(p) for p in parts]
+
+
+def _nearest_index(offsets: List[int], pos: int) -> int:
+    """
+    Index of the offset closest to `pos` in the sorted, non-empty `offsets`;
+    ties go to the earlier one (same as min() over the list in order).
+    """
+    i = bisect_left(offsets, pos)
+    if i == 0:
+        return 0
+    if i == len(offsets):
+        return i - 1
+    return i - 1 if pos - offsets[i - 1] <= offsets[i] - pos else i
+
+
 def _extract_ordering_code(s: str) -> Optional[str]:
-    m = re.search(r"\b((?:9\d)\s?(?:\d{2,4}\s?){3,4})\b", s)
+    m = _ORDERING_CODE_RE.search(s)
     if not m:
         return None
-    digits = re.sub(r"\s+", "", m.group(1))
+    # the match is digits and whitespace only, so str.split() strips exactly what \s would
+    digits = "".join(m.group(1).split())
 
     # NEW: handle the 11-digit Binder format: 2-4-3-2  (e.g., 99 1525 812 04)
     if len(digits) == 11:
@@ -946,11 +1297,11 @@ def _extract_ordering_code(s: str) -> Optional[str]:
         return f"{digits[0:2]} {digits[2:6]} {digits[6:8]} {digits[8:10]}"
 
     # fallback (unchanged)
-    return " ".join(re.findall(r".{1,4}", digits))
+    return " ".join(_DIGIT_QUADS_RE.findall(digits))
 
 
 def _coerce_int(s: str) -> Optional[int]:
     try:
-        return int(re.findall(r"\d+", s)[0])
+        return int(_DIGITS_RE.findall(s)[0])
     except Exception:
         return None
\ No newline at end of file
@@ -1,17 +1,37 @@
 from __future__ import annotations
 import re
+import sys
+from functools import lru_cache
 from typing import Tuple, Optional, List, Dict
 
+# Patterns are compiled once at import; these helpers run per page / per label.
+_NON_KEY_CHARS_RE = re.compile(r"[^\w\-/\. ]+", flags=re.UNICODE)
+_WS_RE = re.compile(r"\s+")
+# characters that only ever separate words in a spec key (dashes, dots, slashes)
+_KEY_SEPARATORS = str.maketrans({c: " " for c in "–—·/\\.-"})
+_MM_RANGE_RE = re.compile(r"([0-9]+(?:[.,][0-9]+)?)\s*-\s*([0-9]+(?:[.,][0-9]+)?)\s*mm\b")
+_IP_CODE_RE = re.compile(r"\bIP\d{2}(?:[A-ZK])?(?:,\s*Outdoor\s*IP\d{2}[A-ZK]?)?", flags=re.I)
+_TEMP_UPPER_RE = re.compile(r"(?:Upper temperature|Obere Grenztemperatur)[^\n]*?([+\-–]?\s*\d{1,3})\s*°C", flags=re.I)
+_TEMP_LOWER_RE = re.compile(r"(?:Lower temperature|Untere Grenztemperatur)[^\n]*?([+\-–]?\s*\d{1,3})\s*°C", flags=re.I)
+# combined 'DE EN' spec label: group 2 is the trailing English part
+_DE_EN_LABEL_RE = re.compile(
+    r"(.+?)\s+([A-Z][A-Za-z0-9 ().,°/%+-]*(?:\s+[A-Za-z][A-Za-z0-9 ().,°/%+-]*)*)$"
+)
+_BILINGUAL_PAREN_RE = re.compile(r"^(.*?\()([^/]+)/([^)]*)\)$")
+_LEGEND_NOISE_RE = re.compile(r"[\d\s,~xØ°A-Za-z]+")
+_CONTACT_NUM_RE = re.compile(r"\b(\d{1,2})\b")
+# contact columns of the binder summary page, whose merged cells get special mapping rules
+_SUMMARY_LAYOUT_CONTACTS = [3, 4, 5, 8, 12]
+_VALUE_TOKEN_RE = re.compile(r"\d+(?:[.,]\d+)?\s*(?:V|A|mm|°C|VDC|VAC|IP[0-9A-Z]+)")
+
+
+# label -> key helpers are pure and see the same few dozen spec labels on every catalog
+# page, so their results are memoized
+@lru_cache(maxsize=2048)
 def to_snake_case(s: str) -> str:
-    s = s.strip()
-    s = s.replace("–", "-").replace("—", "-").replace("·", ".")
-    s = re.sub(r"[^\w\-/\. ]+", " ", s, flags=re.UNICODE)
-    s = s.replace("/", " ").replace("\\", " ")
-    s = s.replace(".", " ")
-    s = s.replace("-", " ")
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    s = s.replace(" ", "_")
-    return s
+    # separators become spaces in one translate; every run of spaces ends up as one "_"
+    s = _NON_KEY_CHARS_RE.sub(" ", s.translate(_KEY_SEPARATORS))
+    return "_".join(s.split()).lower()
 
 
 def parse_mm_range(text: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
@@ -21,7 +41,7 @@ def parse_mm_range(text: Optional[str]) -> Tuple[Optional[float], Optional[float
     if not text:
         return None, None
     t = text.replace("–", "-")
-    m = re.search(r"([0-9]+(?:[.,][0-9]+)?)\s*-\s*([0-9]+(?:[.,][0-9]+)?)\s*mm\b", t)
+    m = _MM_RANGE_RE.search(t)
     if not m:
         return None, None
     lo = float(m.group(1).replace(",", "."))
@@ -30,7 +50,7 @@ def parse_mm_range(text: Optional[str]) -> Tuple[Optional[float], Optional[float
 
 
 def parse_ip_code(page_text: str) -> Optional[str]:
-    m = re.search(r"\bIP\d{2}(?:[A-ZK])?(?:,\s*Outdoor\s*IP\d{2}[A-ZK]?)?", page_text, flags=re.I)
+    m = _IP_CODE_RE.search(page_text)
     return m.group(0).replace(" ", "") if m else None
 
 
@@ -38,28 +58,28 @@ def parse_temp_block(page_text: str) -> Tuple[Optional[float], Optional[float]]:
     """
     Extract 'Upper temperature' / 'Lower temperature' like +85 °C / –40 °C
     """
+    # both limits end in "°C": pages without a degree sign skip the regex scan
+    if "°" not in page_text:
+        return None, None
     tmin = None
     tmax = None
-    # Upper
-    m_up = re.search(r"(?:Upper temperature|Obere Grenztemperatur)[^\n]*?([+\-–]?\s*\d{1,3})\s*°C", page_text, flags=re.I)
+    # separate searches: either label may sit between the other one and its value
+    m_up = _TEMP_UPPER_RE.search(page_text)
     if m_up:
-        tmax = float(re.sub(r"\s+", "", m_up.group(1).replace("–", "-").replace("+", "")))
-    # Lower
-    m_lo = re.search(r"(?:Lower temperature|Untere Grenztemperatur)[^\n]*?([+\-–]?\s*\d{1,3})\s*°C", page_text, flags=re.I)
+        tmax = float(_WS_RE.sub("", m_up.group(1).replace("–", "-").replace("+", "")))
+    m_lo = _TEMP_LOWER_RE.search(page_text)
     if m_lo:
-        tmin = float(re.sub(r"\s+", "", m_lo.group(1).replace("–", "-").replace("+", "")))
+        tmin = float(_WS_RE.sub("", m_lo.group(1).replace("–", "-").replace("+", "")))
     return tmin, tmax
 
 
+@lru_cache(maxsize=2048)
 def english_tail(label: str) -> str:
     """
     Ensure we only keep the English part at the end of a combined 'DE EN' label.
     If it already looks English-only, this is a no-op.
     """
-    m = re.match(
-        r"(.+?)\s+([A-Z][A-Za-z0-9 ().,°/%+-]*(?:\s+[A-Za-z][A-Za-z0-9 ().,°/%+-]*)*)$",
-        label.strip(),
-    )
+    m = _DE_EN_LABEL_RE.match(label.strip())
     if m:
         return m.group(2).strip()
     return label.strip()
@@ -68,7 +88,7 @@ def normalize_bilingual_value(val: str) -> str:
     val = val.strip()
 
     # Pattern: "CuSn (Bronze/bronze)" -> "CuSn (bronze)"
-    m = re.match(r"^(.*?\()([^/]+)/([^)]*)\)$", val)
+    m = _BILINGUAL_PAREN_RE.match(val)
     if m:
         prefix, _, en = m.groups()
         return f"{prefix}{en.strip()})"
@@ -102,14 +122,12 @@ def extract_spec_labels(page_text: str) -> list[str]:
             continue
 
         if not in_block:
-            if "polzahl" in line.lower() and "number of contacts" in line.lower():
+            low = line.lower()
+            if "polzahl" in low and "number of contacts" in low:
                 in_block = True
             continue
 
-        m = re.match(
-            r"(.+?)\s+([A-Z][A-Za-z0-9 ().,°/%+-]*(?:\s+[A-Za-z][A-Za-z0-9 ().,°/%+-]*)*)$",
-            line,
-        )
+        m = _DE_EN_LABEL_RE.match(line)
         if not m:
             break
 
@@ -133,16 +151,13 @@ def extract_spec_values(page_text: str, expected_count: int) -> list[str]:
         return []
 
     # 2) Walk label lines (DE+EN) to find the end of the header block
-    label_pattern = re.compile(
-        r"(.+?)\s+([A-Z][A-Za-z0-9 ().,°/%+-]*(?:\s+[A-Za-z][A-Za-z0-9 ().,°/%+-]*)*)$"
-    )
     last_label_idx = None
 
     for j in range(start + 1, len(lines)):
         line = lines[j].strip()
         if not line:
             continue
-        if label_pattern.match(line):
+        if _DE_EN_LABEL_RE.match(line):
             last_label_idx = j
             continue
         # after seen at least one label, the first non-matching line ends the block
@@ -163,7 +178,7 @@ def extract_spec_values(page_text: str, expected_count: int) -> list[str]:
             # skip obvious blueprint/legend noise:
             #  - pure numbers or tiny tokens
             #  - tokens like "Ø", "1 x", "21M", "SW 18mm", "3 4 5 8 12"
-            if re.fullmatch(r"[\d\s,~xØ°A-Za-z]+", line) and len(line) <= 11:
+            if _LEGEND_NOISE_RE.fullmatch(line) and len(line) <= 11:
                 continue
 
         values.append(line)
@@ -181,7 +196,7 @@ def parse_contact_header(page_text: str) -> list[int]:
     """
     for line in page_text.splitlines():
         if "Number of contacts" in line:
-            nums = re.findall(r"\b(\d{1,2})\b", line)
+            nums = _CONTACT_NUM_RE.findall(line)
             return [int(n) for n in nums]
     return []
 
@@ -204,9 +219,12 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
 
     per_contact: dict[int, dict[str, str]] = {c: {} for c in contacts} if contacts else {}
     shared_only: dict[str, str] = {}
+    # the layout checks below only depend on the contact columns, not on the label
+    is_summary_layout = sorted(contacts) == _SUMMARY_LAYOUT_CONTACTS
 
     for label, raw_val in zip(labels, values):
-        key = to_snake_case(english_tail(label))
+        # interned: the same key string is shared by every contact/product spec dict built from it
+        key = sys.intern(to_snake_case(english_tail(label)))
         raw_val = raw_val.strip()
         if not raw_val:
             continue
@@ -216,13 +234,11 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
         val = normalize_bilingual_value(raw_val)
         
         raw_lower = raw_val.lower()
-        contact_set = sorted(contacts) if contacts else []
 
-        
         # termination: "schrauben/screw löten/solder" → first 4 screw, last solder
         if (
             contacts
-            and contact_set == [3, 4, 5, 8, 12]
+            and is_summary_layout
             and key == "termination"
             and ("screw" in raw_lower)
             and ("solder" in raw_lower)
@@ -235,7 +251,7 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
         # mechanical operation: "> 50 ...  > 100 ..." → 3/4/5 : >50, 8/12 : >100
         if (
             contacts
-            and contact_set == [3, 4, 5, 8, 12]
+            and is_summary_layout
             and key == "mechanical_operation"
             and ("> 50" in raw_lower or "≥ 50" in raw_lower)
             and ("> 100" in raw_lower or "≥ 100" in raw_lower)
@@ -249,7 +265,7 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
         # contact plating: "CuSnZn (Optalloy/optalloy) Au (Gold/gold)" → 3/4/5 optalloy, 8/12 gold
         if (
             contacts
-            and contact_set == [3, 4, 5, 8, 12]
+            and is_summary_layout
             and key == "contact_plating"
             and ("optalloy" in raw_lower)
             and ("au" in raw_lower)
@@ -263,10 +279,7 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
             continue
 
         # tokens like '250 V', '60 V', '4 A', '8 mm', 'IP67'
-        tokens = re.findall(
-            r"\d+(?:[.,]\d+)?\s*(?:V|A|mm|°C|VDC|VAC|IP[0-9A-Z]+)",
-            raw_val,
-        )
+        tokens = _VALUE_TOKEN_RE.findall(raw_val)
 
         if contacts and tokens:
             n_contacts = len(contacts)
@@ -274,7 +287,7 @@ def build_contact_value_map(page_text: str, table_contacts: list[int]) -> dict[i
 
             # Used for rated_voltage, rated_impulse_voltage, rated_current_40_c.
             # Special case for binder summary layout: 5 contacts (3,4,5,8,12) & 3 tokens
-            if contact_set == [3, 4, 5, 8, 12] and n_tokens == 3 and n_contacts == 5:
+            if is_summary_layout and n_tokens == 3 and n_contacts == 5:
                 if key in ("rated_voltage", "rated_impulse_voltage"):
                     groups = [2, 1, 2]   # 3&4 → first; 5 → middle; 8&12 → last
                 elif key == "rated_current_40_c":